@@ -0,0 +1,150 @@
+"""Benchmark the control loop of general thermostats.
+
+Drives the thermostats with a deterministic random walk of sensor temperatures and prints
+one JSON object per scenario:
+
+    python benchmarks/bench_control_loop.py [--events N] [--entities 1,100,1000] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from bisect import bisect_right
+from datetime import timedelta
+import gc
+import json
+from pathlib import Path
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Harness  # noqa: E402
+
+TARGET_TEMP = 21.0
+BATCH_SIZE = 50
+
+SCENARIOS: dict[str, dict[str, Any]] = {
+    "plain": {},
+    "min_cycle_duration": {"min_cycle_duration": timedelta(minutes=5)},
+    "keep_alive": {"keep_alive": timedelta(seconds=1)},
+}
+
+
+def _percentile(values: list[float], percentile: float) -> float | None:
+    """Return the percentile of the values with nearest-rank method."""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, round(percentile / 100 * len(values)) - 1))]
+
+
+def _zone_configs(entities: int, options: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": f"Bench {index}",
+            "unique_id": f"bench_{index}",
+            "heater": f"switch.bench_heater_{index}",
+            "target_sensor": f"sensor.bench_temperature_{index}",
+            "target_temp": TARGET_TEMP,
+            "initial_hvac_mode": "heat",
+            **options,
+        }
+        for index in range(entities)
+    ]
+
+
+async def async_run_scenario(name: str, entities: int, events: int, seed: int) -> dict[str, Any]:
+    """Run a scenario and return its results."""
+    harness = await Harness.async_create()
+    configs = _zone_configs(entities, SCENARIOS[name])
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    await harness.async_add_thermostats(configs)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rng = random.Random(seed)
+    temperatures = [TARGET_TEMP] * entities
+    sensor_set_at: dict[str, list[float]] = {config["heater"]: [] for config in configs}
+    heater_of_sensor = {config["target_sensor"]: config["heater"] for config in configs}
+    first_call = len(harness.actuator_calls)
+    first_write = harness.climate_state_writes
+
+    start = time.perf_counter()
+    for event in range(events):
+        index = event % entities
+        temperatures[index] += rng.uniform(-0.15, 0.15) + (TARGET_TEMP - temperatures[index]) * 0.02
+        sensor = configs[index]["target_sensor"]
+        sensor_set_at[heater_of_sensor[sensor]].append(time.perf_counter())
+        harness.async_set_sensor(sensor, temperatures[index])
+        if event % BATCH_SIZE == BATCH_SIZE - 1:
+            await harness.hass.async_block_till_done()
+    await harness.hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    # The latency of a switching call is measured from the last sensor event before it
+    latencies = []
+    for call in harness.actuator_calls[first_call:]:
+        set_at = sensor_set_at[call.entity_id]
+        if call.changed and (index := bisect_right(set_at, call.timestamp)):
+            latencies.append(call.timestamp - set_at[index - 1])
+
+    await harness.async_stop()
+    return {
+        "scenario": name,
+        "entities": entities,
+        "events": events,
+        "events_per_sec": events / elapsed,
+        "latency_p50_ms": None if (p50 := _percentile(latencies, 50)) is None else p50 * 1000,
+        "latency_p99_ms": None if (p99 := _percentile(latencies, 99)) is None else p99 * 1000,
+        "actuator_calls": len(harness.actuator_calls) - first_call,
+        "state_writes_per_event": (harness.climate_state_writes - first_write) / events,
+        "memory_per_entity_bytes": (after - before) / entities,
+    }
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run all scenarios."""
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout  # noqa: SIM115
+    try:
+        for entities in args.entities:
+            for name in args.scenarios:
+                result = await async_run_scenario(name, entities, max(args.events, entities), args.seed)
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000, help="sensor events per scenario")
+    parser.add_argument(
+        "--entities",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=[1, 100, 1000],
+        help="comma separated entity counts",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=list(SCENARIOS),
+        help=f"comma separated scenarios of {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON lines to this file instead of stdout")
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""In-process Home Assistant stand-in to drive general thermostats offline.
+
+Only Home Assistant's core objects (event bus, state machine, service registry) and the
+registries required by the entities are set up, no integrations are loaded. The heaters
+are simulated by stand-in `homeassistant.turn_on` / `homeassistant.turn_off` services that
+switch the heater states and record each call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_UNIQUE_ID,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import (
+    DOMAIN as HOMEASSISTANT_DOMAIN,
+    CoreState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+    restore_state as rs,
+)
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.general_thermostat.climate import (  # noqa: E402
+    PLATFORM_SCHEMA_COMMON,
+    GeneralThermostat,
+    _create_thermostat,
+)
+from custom_components.general_thermostat.const import (  # noqa: E402
+    CONF_HEATER,
+    CONF_SENSOR,
+    DOMAIN,
+)
+from custom_components.general_thermostat.startup import (  # noqa: E402
+    async_setup_startup_coordinator,
+)
+from custom_components.general_thermostat.store import async_get_store  # noqa: E402
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ActuatorCall:
+    """A recorded stand-in actuator service call."""
+
+    timestamp: float
+    entity_id: str
+    service: str
+    changed: bool
+
+
+@dataclass(slots=True)
+class StateWrite:
+    """A recorded state write of a thermostat."""
+
+    timestamp: float
+    entity_id: str
+    state: str
+    attributes: dict[str, Any]
+
+
+@dataclass
+class Harness:
+    """A running Home Assistant stand-in with general thermostats."""
+
+    hass: HomeAssistant
+    platform: EntityPlatform
+    clock: Callable[[], float] = time.perf_counter
+    thermostats: list[GeneralThermostat] = field(default_factory=list)
+    actuator_calls: list[ActuatorCall] = field(default_factory=list)
+    climate_state_writes: int = 0
+    state_writes: list[StateWrite] | None = None
+
+    @classmethod
+    async def async_create(
+        cls,
+        config_dir: str | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> Harness:
+        """Create the Home Assistant stand-in."""
+        if config_dir is None:
+            config_dir = tempfile.mkdtemp(prefix=f"{DOMAIN}_bench_")
+        hass = HomeAssistant(config_dir)
+        hass.loop_thread_id = threading.get_ident()
+        hass.config.config_dir = config_dir
+        for load in (ar, dr, er, fr, lr, rs):
+            await load.async_load(hass)
+        # Start the thermostats without rate limiting, the benchmarks measure the control loop
+        async_setup_startup_coordinator(hass, 1_000_000, timedelta(0))
+        await async_get_store(hass).async_load()
+        hass.set_state(CoreState.running)
+
+        platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain="climate",
+            platform_name=DOMAIN,
+            platform=None,
+            scan_interval=timedelta(0),
+            entity_namespace=None,
+        )
+        harness = cls(hass, platform, clock)
+        hass.services.async_register(
+            HOMEASSISTANT_DOMAIN, SERVICE_TURN_ON, harness._async_handle_actuator_call
+        )
+        hass.services.async_register(
+            HOMEASSISTANT_DOMAIN, SERVICE_TURN_OFF, harness._async_handle_actuator_call
+        )
+        hass.bus.async_listen(EVENT_STATE_CHANGED, harness._async_state_changed)
+        return harness
+
+    async def async_add_thermostats(
+        self,
+        configs: list[Mapping[str, Any]],
+        initial_states: Mapping[str, str] | None = None,
+    ) -> list[GeneralThermostat]:
+        """Create the sensor and heater states, then add the thermostats."""
+        initial_states = initial_states or {}
+        thermostats = []
+        for index, config in enumerate(configs):
+            config = PLATFORM_SCHEMA_COMMON(dict(config))
+            for sensor in config[CONF_SENSOR]:
+                self.hass.states.async_set(
+                    sensor,
+                    initial_states.get(sensor, "20.0"),
+                    {"unit_of_measurement": "°C"},
+                )
+            for heater in config[CONF_HEATER]:
+                self.hass.states.async_set(heater, initial_states.get(heater, STATE_OFF))
+            thermostats.append(_create_thermostat(self.hass, config, config.get(CONF_UNIQUE_ID, f"bench_{index}")))
+        await self.platform.async_add_entities(thermostats)
+        await self.hass.async_block_till_done()
+        self.thermostats.extend(thermostats)
+        return thermostats
+
+    @callback
+    def async_set_sensor(self, entity_id: str, temperature: float) -> None:
+        """Report a new sensor temperature."""
+        self.hass.states.async_set(entity_id, f"{temperature:.2f}", {"unit_of_measurement": "°C"})
+
+    async def _async_handle_actuator_call(self, call: ServiceCall) -> None:
+        """Switch the stand-in heaters and record the call."""
+        entity_ids = call.data[ATTR_ENTITY_ID]
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        state = STATE_ON if call.service == SERVICE_TURN_ON else STATE_OFF
+        timestamp = self.clock()
+        for entity_id in entity_ids:
+            changed = not self.hass.states.is_state(entity_id, state)
+            self.actuator_calls.append(ActuatorCall(timestamp, entity_id, call.service, changed))
+            self.hass.states.async_set(entity_id, state)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        if event.data["entity_id"].startswith("climate."):
+            self.climate_state_writes += 1
+            if self.state_writes is not None and (new_state := event.data["new_state"]) is not None:
+                self.state_writes.append(
+                    StateWrite(self.clock(), new_state.entity_id, new_state.state, dict(new_state.attributes))
+                )
+
+    async def async_stop(self) -> None:
+        """Stop the Home Assistant stand-in."""
+        await self.hass.async_stop(force=True)
@@ -0,0 +1,259 @@
+"""Record and replay the input stream of a general thermostat.
+
+Record the sensor and heater state changes and the service calls of a live thermostat
+through the websocket API into a line-delimited JSON trace:
+
+    python benchmarks/replay.py record --url ws://homeassistant.local:8123/api/websocket \\
+        --token TOKEN --thermostat climate.living_room --config living_room.json trace.jsonl
+
+Replay the trace offline under a virtual clock, faster than real time, and print the
+actuator commands and the state writes of the thermostat as JSON lines:
+
+    python benchmarks/replay.py replay trace.jsonl [--apply-heater-events] [--output FILE]
+
+The first line of the trace is a header with the thermostat config (the platform options,
+at least `heater` and `target_sensor`) and the initial sensor and heater states, each
+further line is one input with its time `t` in seconds from the start of the recording:
+
+    {"t": 12.5, "sensor": "21.3", "entity_id": "sensor.living_room_temperature"}
+    {"t": 14.0, "heater": "on", "entity_id": "switch.living_room_heater"}
+    {"t": 30.25, "service": "climate.set_temperature", "data": {"temperature": 22}}
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime
+import json
+from pathlib import Path
+import sys
+from typing import Any, TextIO
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Harness  # noqa: E402
+from virtual_clock import VirtualClockEventLoop, virtual_wall_clock  # noqa: E402
+
+from homeassistant.const import ATTR_ENTITY_ID  # noqa: E402
+from homeassistant.helpers import config_validation as cv  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.general_thermostat.climate import GeneralThermostat  # noqa: E402
+from custom_components.general_thermostat.const import (  # noqa: E402
+    CONF_HEATER,
+    CONF_SENSOR,
+)
+
+TRACE_FORMAT = "general_thermostat_trace"
+TRACE_VERSION = 1
+REPLAY_TAIL = 3600
+
+
+# Services recorded and replayed, with the thermostat's method that handles them
+SERVICE_METHODS = {
+    "climate.set_temperature": "async_set_temperature",
+    "climate.set_hvac_mode": "async_set_hvac_mode",
+    "climate.set_preset_mode": "async_set_preset_mode",
+    "climate.turn_on": "async_turn_on",
+    "climate.turn_off": "async_turn_off",
+    "general_thermostat.set_preset_temperature": "async_handle_set_preset_temperature_service",
+    "general_thermostat.reset_preset_temperature": "async_handle_reset_preset_temperature_service",
+    "general_thermostat.set_tolerance": "async_handle_set_tolerance_service",
+}
+
+
+async def async_record(args: argparse.Namespace) -> None:
+    """Record the input stream of a thermostat until interrupted or the duration elapses."""
+    import aiohttp  # noqa: PLC0415
+
+    config: dict[str, Any] = json.loads(Path(args.config).read_text(encoding="utf-8"))
+    sensors, heaters = cv.entity_ids(config[CONF_SENSOR]), cv.entity_ids(config[CONF_HEATER])
+
+    async with aiohttp.ClientSession() as session, session.ws_connect(args.url) as ws:
+        await ws.receive_json()
+        await ws.send_json({"type": "auth", "access_token": args.token})
+        if (msg := await ws.receive_json())["type"] != "auth_ok":
+            raise SystemExit(f"Authentication failed: {msg}")
+        await ws.send_json({"id": 1, "type": "get_states"})
+        states = {
+            state["entity_id"]: state["state"]
+            for state in (await ws.receive_json())["result"]
+            if state["entity_id"] in (*sensors, *heaters)
+        }
+        await ws.send_json({"id": 2, "type": "subscribe_events", "event_type": "state_changed"})
+        await ws.send_json({"id": 3, "type": "subscribe_events", "event_type": "call_service"})
+
+        start = dt_util.utcnow()
+        with open(args.trace, "w", encoding="utf-8") as trace:
+            _write(
+                trace,
+                {
+                    "format": TRACE_FORMAT,
+                    "version": TRACE_VERSION,
+                    "start": start.isoformat(),
+                    "config": config,
+                    "states": states,
+                },
+            )
+            async with asyncio.timeout(args.duration):
+                async for msg in ws:
+                    if (data := msg.json()).get("type") != "event":
+                        continue
+                    event = data["event"]
+                    t = round((dt_util.parse_datetime(event["time_fired"]) - start).total_seconds(), 3)
+                    if (record := _record_of_event(event, args.thermostat, sensors, heaters)) is not None:
+                        _write(trace, {"t": t, **record})
+                        trace.flush()
+
+
+def _record_of_event(
+    event: dict[str, Any], thermostat: str, sensors: list[str], heaters: list[str]
+) -> dict[str, Any] | None:
+    """Return the trace record of an input event of the thermostat."""
+    data = event["data"]
+    if event["event_type"] == "state_changed":
+        if (new_state := data["new_state"]) is None:
+            return None
+        if data["entity_id"] in sensors:
+            return {"sensor": new_state["state"], "entity_id": data["entity_id"]}
+        if data["entity_id"] in heaters:
+            return {"heater": new_state["state"], "entity_id": data["entity_id"]}
+        return None
+    service = f"{data['domain']}.{data['service']}"
+    service_data = dict(data.get("service_data") or {})
+    entity_ids = service_data.pop(ATTR_ENTITY_ID, [])
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    if service not in SERVICE_METHODS or thermostat not in entity_ids:
+        return None
+    return {"service": service, "data": service_data}
+
+
+def _write(trace: TextIO, record: dict[str, Any]) -> None:
+    trace.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+async def async_replay(args: argparse.Namespace) -> None:
+    """Replay a trace under the virtual clock."""
+    with open(args.trace, encoding="utf-8") as trace:
+        header = json.loads(trace.readline())
+        if header.get("format") != TRACE_FORMAT or header.get("version") != TRACE_VERSION:
+            raise SystemExit(f"Unsupported trace: {args.trace}")
+        records = [json.loads(line) for line in trace if line.strip()]
+
+    loop: VirtualClockEventLoop = asyncio.get_running_loop()  # type: ignore[assignment]
+    origin = loop.time()
+    with virtual_wall_clock(loop, dt_util.parse_datetime(header["start"]) or datetime.now()):
+        harness = await Harness.async_create(clock=lambda: round(loop.time() - origin, 3))
+        harness.state_writes = []
+        [thermostat] = await harness.async_add_thermostats([header["config"]], header["states"])
+        # The trace times are relative to the thermostat being set up
+        origin = loop.time()
+        config = header["config"]
+        sensors = cv.entity_ids(config[CONF_SENSOR])
+        heaters = cv.entity_ids(config[CONF_HEATER])
+        pending: set[asyncio.Task[None]] = set()
+
+        def _apply(record: dict[str, Any]) -> None:
+            if "sensor" in record:
+                harness.hass.states.async_set(
+                    record.get("entity_id", sensors[0]), record["sensor"], {"unit_of_measurement": "°C"}
+                )
+            elif "heater" in record:
+                if args.apply_heater_events:
+                    harness.hass.states.async_set(record.get("entity_id", heaters[0]), record["heater"])
+            elif (method := SERVICE_METHODS.get(record["service"])) is not None:
+                task = loop.create_task(_async_call(thermostat, method, record["data"]))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        for record in records:
+            loop.call_at(origin + record["t"], _apply, record)
+        await asyncio.sleep((records[-1]["t"] if records else 0) + REPLAY_TAIL)
+        if pending:
+            await asyncio.wait(pending)
+
+        output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout  # noqa: SIM115
+        try:
+            _write_results(output, harness)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        await harness.async_stop()
+
+
+async def _async_call(thermostat: GeneralThermostat, method: str, data: dict[str, Any]) -> None:
+    await getattr(thermostat, method)(**data)
+
+
+def _write_results(output: TextIO, harness: Harness) -> None:
+    """Write the actuator commands, the state writes and a summary ordered by time."""
+    assert harness.state_writes is not None
+    results: list[tuple[float, int, dict[str, Any]]] = [
+        (call.timestamp, 0, {"t": call.timestamp, "command": call.service, "entity_id": call.entity_id, "changed": call.changed})
+        for call in harness.actuator_calls
+    ]
+    results.extend(
+        (
+            write.timestamp,
+            1,
+            {
+                "t": write.timestamp,
+                "state": write.state,
+                "hvac_action": write.attributes.get("hvac_action"),
+                "current_temperature": write.attributes.get("current_temperature"),
+                "temperature": write.attributes.get("temperature"),
+                "preset_mode": write.attributes.get("preset_mode"),
+            },
+        )
+        for write in harness.state_writes
+    )
+    for _, _, result in sorted(results, key=lambda result: result[:2]):
+        _write(output, result)
+    _write(
+        output,
+        {
+            "actuator_commands": len(harness.actuator_calls),
+            "switch_cycles": sum(1 for call in harness.actuator_calls if call.changed and call.service == "turn_on"),
+            "state_writes": len(harness.state_writes),
+        },
+    )
+
+
+def main() -> None:
+    """Parse the arguments and record or replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record = subparsers.add_parser("record", help="record a live thermostat")
+    record.add_argument("--url", required=True, help="websocket API url")
+    record.add_argument("--token", required=True, help="long-lived access token")
+    record.add_argument("--thermostat", required=True, help="climate entity id of the thermostat")
+    record.add_argument("--config", required=True, help="JSON file with the thermostat's platform options")
+    record.add_argument("--duration", type=float, help="seconds to record, default until interrupted")
+    record.add_argument("trace")
+    replay = subparsers.add_parser("replay", help="replay a trace offline")
+    replay.add_argument(
+        "--apply-heater-events",
+        action="store_true",
+        help="apply the recorded heater state changes, by default the heater follows the replayed commands",
+    )
+    replay.add_argument("--output", help="write the JSON lines to this file instead of stdout")
+    replay.add_argument("trace")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        try:
+            asyncio.run(async_record(args))
+        except (KeyboardInterrupt, TimeoutError):
+            pass
+        return
+    loop = VirtualClockEventLoop()
+    try:
+        loop.run_until_complete(async_replay(args))
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Virtual clock event loop to run Home Assistant faster than real time."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+_T = TypeVar("_T")
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop with a virtual monotonic clock.
+
+    Whenever there is nothing ready to run, the clock jumps to the earliest scheduled
+    timer instead of waiting for it, so timers fire in order without any real delay. While
+    executor jobs (eg. loading the registries) are running the clock stands still, the loop
+    waits for them in real time, so no timer fires before the work it follows is done.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the loop."""
+        super().__init__()
+        self._virtual_time = 0.0
+        self._executor_jobs = 0
+
+    def time(self) -> float:
+        """Return the virtual monotonic time."""
+        return self._virtual_time
+
+    def run_in_executor(self, executor: Any, func: Callable[..., _T], *args: Any) -> asyncio.Future[_T]:
+        """Run the job in the executor, the clock stands still until it is done."""
+        future = super().run_in_executor(executor, func, *args)
+        self._executor_jobs += 1
+        future.add_done_callback(self._executor_job_done)
+        return future
+
+    def _executor_job_done(self, _: asyncio.Future[Any]) -> None:
+        self._executor_jobs -= 1
+
+    def _run_once(self) -> None:
+        if not self._ready and self._scheduled and not self._executor_jobs:  # type: ignore[attr-defined]
+            self._virtual_time = max(self._virtual_time, self._scheduled[0].when())  # type: ignore[attr-defined]
+        super()._run_once()  # type: ignore[misc]
+
+
+@contextmanager
+def virtual_wall_clock(loop: VirtualClockEventLoop, start: datetime) -> Iterator[None]:
+    """Derive the wall clock used by Home Assistant from the loop's virtual clock."""
+    base = start.timestamp() - loop.time()
+
+    def _timestamp() -> float:
+        return base + loop.time()
+
+    def _utcnow() -> datetime:
+        return datetime.fromtimestamp(_timestamp(), UTC)
+
+    with (
+        patch("time.time", _timestamp),
+        patch.object(dt_util, "utcnow", _utcnow),
+        patch("homeassistant.helpers.event.time_tracker_utcnow", _utcnow),
+        patch("homeassistant.helpers.event.time_tracker_timestamp", _timestamp),
+    ):
+        yield
@@ -1,17 +1,82 @@
 """The general_thermostat component."""
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ENTITY_ID, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device import async_remove_stale_devices_links_keep_entity_device
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_HEATER, DOMAIN, PLATFORMS
+from .const import (
+    CONF_HEAT_SOURCES,
+    CONF_HEATER,
+    CONF_MAX_ACTIVE_HEATERS,
+    CONF_MAX_HEATER_POWER,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    CONF_STARTUP_CONCURRENCY,
+    CONF_STARTUP_DELAY,
+    DEFAULT_STARTUP_CONCURRENCY,
+    DEFAULT_STARTUP_DELAY,
+    DOMAIN,
+    PLATFORMS,
+)
+from .heat_source import async_setup_heat_sources
+from .load_manager import async_setup_load_manager
+from .startup import async_setup_startup_coordinator
+from .store import async_get_store
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_STARTUP_CONCURRENCY, default=DEFAULT_STARTUP_CONCURRENCY
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_STARTUP_DELAY, default=DEFAULT_STARTUP_DELAY
+                ): cv.positive_time_period,
+                vol.Optional(CONF_MAX_ACTIVE_HEATERS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_MAX_HEATER_POWER): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                vol.Optional(CONF_HEAT_SOURCES, default=[]): [
+                    vol.Schema(
+                        {
+                            vol.Required(CONF_ENTITY_ID): cv.entity_id,
+                            vol.Optional(CONF_MIN_ON_TIME): cv.positive_time_period,
+                            vol.Optional(CONF_MIN_OFF_TIME): cv.positive_time_period,
+                        }
+                    )
+                ],
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the general_thermostat component."""
 
-    await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
+    conf = config.get(DOMAIN, {})
+    async_setup_startup_coordinator(
+        hass,
+        conf.get(CONF_STARTUP_CONCURRENCY, DEFAULT_STARTUP_CONCURRENCY),
+        conf.get(CONF_STARTUP_DELAY, DEFAULT_STARTUP_DELAY),
+    )
+    async_setup_heat_sources(hass, conf.get(CONF_HEAT_SOURCES, []))
+    async_setup_load_manager(
+        hass, conf.get(CONF_MAX_ACTIVE_HEATERS), conf.get(CONF_MAX_HEATER_POWER)
+    )
+    await async_get_store(hass).async_load()
+    # Only the climate platform can be configured in YAML
+    await async_setup_reload_service(hass, DOMAIN, [Platform.CLIMATE])
     return True
 
 
@@ -23,16 +88,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.entry_id,
         entry.options[CONF_HEATER],
     )
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # The sensors read the thermostat's metrics, the climate platform is set up first
+    for platform in PLATFORMS:
+        await hass.config_entries.async_forward_entry_setups(entry, [platform])
     entry.async_on_unload(entry.add_update_listener(config_entry_update_listener))
     return True
 
 
 async def config_entry_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update listener, called when the config entry options are changed."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Update listener, called when the config entry options are changed.
+
+    The options are applied to the live thermostat, the entry is reloaded only if that is
+    not possible, ie. the heater or the sensor is changed.
+    """
+    thermostat = getattr(entry, "runtime_data", None)
+    if thermostat is None or not await thermostat.async_reconfigure(entry.options):
+        await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a removed config entry."""
+    async_get_store(hass).async_remove(entry.entry_id)
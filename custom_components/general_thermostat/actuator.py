@@ -0,0 +1,191 @@
+"""Actuator command handling for general thermostats."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from time import perf_counter
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    DOMAIN as HOMEASSISTANT_DOMAIN,
+    Context,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_call_later
+
+from .metrics import ControlMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIRMATION_TIMEOUT = 10.0
+MAX_CONFIRMATION_TIMEOUT = 120.0
+MAX_RETRIES = 3
+
+
+def _is_state_reached(state: State | None, on: bool) -> bool:
+    """Return True if the actuator state is the commanded state."""
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return False
+    return (state.state == STATE_ON) == on
+
+
+class ActuatorCommander:
+    """Send turn on/off commands to a group of actuators without duplicates.
+
+    The last commanded state and the in-flight command are remembered. A command is sent
+    in a single service call to the members that are not in the commanded state yet, and
+    it is confirmed by their state changes. If they don't arrive in time, the command is
+    retried to the unconfirmed members with exponential backoff up to MAX_RETRIES times.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_ids: list[str], metrics: ControlMetrics) -> None:
+        """Initialize the commander."""
+        self._hass = hass
+        self.entity_ids = entity_ids
+        self._metrics = metrics
+        self.commanded: bool | None = None
+        self.pending: bool | None = None
+        self._unconfirmed: list[str] = []
+        self._sent_at = 0.0
+        self._context: Context | None = None
+        self._retries_left = 0
+        self._timeout = CONFIRMATION_TIMEOUT
+        self._remove_timeout: CALLBACK_TYPE | None = None
+        self._timeout_job = HassJob(self._async_confirmation_timed_out, cancel_on_shutdown=True)
+        self.duplicates = 0
+        self.retries = 0
+
+    async def async_turn_on(self, context: Context | None, repeat: bool = False) -> None:
+        """Turn the actuators on."""
+        await self._async_command(True, context, repeat)
+
+    async def async_turn_off(self, context: Context | None, repeat: bool = False) -> None:
+        """Turn the actuators off."""
+        await self._async_command(False, context, repeat)
+
+    async def _async_command(self, on: bool, context: Context | None, repeat: bool) -> None:
+        """Send the command unless it is a duplicate.
+
+        Repeated (keep-alive) commands are sent to all the members even if they are already
+        in the commanded state, but never while the same command is in flight.
+        """
+        if self.pending == on:
+            self.duplicates += 1
+            return
+        targets = [
+            entity_id
+            for entity_id in self.entity_ids
+            if not _is_state_reached(self._hass.states.get(entity_id), on)
+        ]
+        if not targets and not repeat and self.pending is None:
+            self.duplicates += 1
+            return
+
+        self._async_cancel_timeout()
+        self.commanded = on
+        self._context = context
+        if targets:
+            self.pending = on
+            self._unconfirmed = targets
+            self._sent_at = perf_counter()
+            self._retries_left = MAX_RETRIES
+            self._timeout = CONFIRMATION_TIMEOUT
+            self._async_arm_timeout()
+        else:
+            # There will be no state change to confirm the command
+            self.pending = None
+            self._unconfirmed = []
+        try:
+            # Keep-alive refreshes all the members, and without targets an opposite command
+            # is in flight, it is overridden on all the members
+            await self._async_call_service(on, self.entity_ids if repeat or not targets else targets)
+        except Exception:
+            self.pending = None
+            self._unconfirmed = []
+            self._async_cancel_timeout()
+            raise
+
+    async def _async_call_service(self, on: bool, entity_ids: list[str]) -> None:
+        data = {ATTR_ENTITY_ID: entity_ids}
+        if on:
+            self._metrics.turn_on_calls += 1
+        else:
+            self._metrics.turn_off_calls += 1
+        await self._hass.services.async_call(
+            HOMEASSISTANT_DOMAIN,
+            SERVICE_TURN_ON if on else SERVICE_TURN_OFF,
+            data,
+            context=self._context,
+        )
+
+    @callback
+    def async_state_changed(self, state: State | None) -> None:
+        """Confirm the in-flight command based on a member's new state.
+
+        The round trip of the command is measured from sending it, including its retries,
+        to the state change of its last member.
+        """
+        if (self.pending is not None
+            and state is not None
+            and state.entity_id in self._unconfirmed
+            and _is_state_reached(state, self.pending)
+        ):
+            self._unconfirmed.remove(state.entity_id)
+            if not self._unconfirmed:
+                self.pending = None
+                self._async_cancel_timeout()
+                self._metrics.command_round_trip.observe(perf_counter() - self._sent_at)
+
+    @callback
+    def _async_arm_timeout(self) -> None:
+        self._remove_timeout = async_call_later(self._hass, self._timeout, self._timeout_job)
+
+    @callback
+    def _async_cancel_timeout(self) -> None:
+        if self._remove_timeout is not None:
+            self._remove_timeout()
+            self._remove_timeout = None
+
+    async def _async_confirmation_timed_out(self, _: datetime) -> None:
+        """Retry the in-flight command to the unconfirmed members with exponential backoff."""
+        self._remove_timeout = None
+        if (on := self.pending) is None:
+            return
+        if self._retries_left <= 0:
+            _LOGGER.warning(
+                "Actuator(s) %s did not confirm turning %s, giving up",
+                ", ".join(self._unconfirmed),
+                "on" if on else "off",
+            )
+            self.pending = None
+            self._unconfirmed = []
+            return
+        self._retries_left -= 1
+        self.retries += 1
+        self._timeout = min(self._timeout * 2, MAX_CONFIRMATION_TIMEOUT)
+        _LOGGER.debug(
+            "Actuator(s) %s did not confirm turning %s, retrying",
+            ", ".join(self._unconfirmed),
+            "on" if on else "off",
+        )
+        self._async_arm_timeout()
+        await self._async_call_service(on, list(self._unconfirmed))
+
+    @callback
+    def async_cancel(self) -> None:
+        """Forget the in-flight command."""
+        self.pending = None
+        self._unconfirmed = []
+        self._async_cancel_timeout()
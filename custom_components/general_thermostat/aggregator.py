@@ -0,0 +1,136 @@
+"""Streaming aggregation of the temperature sensors of general thermostats."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import timedelta
+import math
+from statistics import fmean, median
+
+AGGREGATION_EMA = "ema"
+AGGREGATION_MEAN = "mean"
+AGGREGATION_MEDIAN = "median"
+AGGREGATIONS = [AGGREGATION_MEAN, AGGREGATION_MEDIAN, AGGREGATION_EMA]
+
+# Upper limit of the readings kept in a sensor's window, to bound the memory used
+MAX_WINDOW_READINGS = 64
+
+
+class _SensorWindow:
+    """The recent readings of a sensor and their aggregate."""
+
+    __slots__ = ("readings", "sorted", "sum", "timestamp", "value")
+
+    def __init__(self) -> None:
+        """Initialize the window."""
+        self.readings: deque[tuple[float, float]] = deque()
+        self.sorted: list[float] = []
+        self.sum = 0.0
+        self.timestamp = 0.0
+        self.value: float | None = None
+
+    def add(self, method: str, window: float, value: float, timestamp: float) -> None:
+        """Add a reading and update the aggregate of the window."""
+        if not window:
+            self.value = value
+        elif method == AGGREGATION_EMA:
+            # Time weighted exponential moving average, the window is its time constant
+            if self.value is None:
+                self.value = value
+            else:
+                alpha = 1 - math.exp(-max(timestamp - self.timestamp, 0) / window)
+                self.value += alpha * (value - self.value)
+        else:
+            self.readings.append((timestamp, value))
+            self.sum += value
+            if method == AGGREGATION_MEDIAN:
+                insort(self.sorted, value)
+            while self.readings and (
+                self.readings[0][0] <= timestamp - window
+                or len(self.readings) > MAX_WINDOW_READINGS
+            ):
+                _, old_value = self.readings.popleft()
+                self.sum -= old_value
+                if method == AGGREGATION_MEDIAN:
+                    del self.sorted[bisect_left(self.sorted, old_value)]
+            if method == AGGREGATION_MEDIAN:
+                self.value = median(self.sorted)
+            else:
+                self.value = self.sum / len(self.readings)
+        self.timestamp = timestamp
+
+    def clear(self) -> None:
+        """Forget the readings."""
+        self.readings.clear()
+        self.sorted.clear()
+        self.sum = 0.0
+        self.value = None
+
+
+class SensorAggregator:
+    """Combine the readings of several temperature sensors into a single temperature.
+
+    The readings of each sensor are aggregated over a time window (mean, median or EMA
+    with the window as time constant, with no window the latest reading is used), then the
+    sensors are combined with the mean, or the median for the median aggregation. Sensors
+    without a reading for max_age are left out, and if there are at least 3 sensors, the
+    ones deviating more than max_deviation from their median are left out too.
+    """
+
+    __slots__ = ("_max_age", "_max_deviation", "_method", "_sensors", "_window", "value")
+
+    def __init__(
+        self,
+        entity_ids: list[str],
+        method: str,
+        window: timedelta | None,
+        max_age: timedelta | None,
+        max_deviation: float | None,
+    ) -> None:
+        """Initialize the aggregator."""
+        self._sensors = {entity_id: _SensorWindow() for entity_id in entity_ids}
+        self._method = method
+        self._window = window.total_seconds() if window else 0.0
+        self._max_age = max_age.total_seconds() if max_age else None
+        self._max_deviation = max_deviation
+        self.value: float | None = None
+
+    @property
+    def max_age(self) -> float | None:
+        """Return the seconds without a reading after which a sensor is left out."""
+        return self._max_age
+
+    def update(self, entity_id: str, value: float, timestamp: float) -> float | None:
+        """Add a reading of a sensor, return the new aggregate temperature."""
+        self._sensors[entity_id].add(self._method, self._window, value, timestamp)
+        return self._combine(timestamp)
+
+    def discard(self, entity_id: str) -> None:
+        """Forget the readings of a sensor that became unavailable."""
+        self._sensors[entity_id].clear()
+
+    def _combine(self, timestamp: float) -> float | None:
+        """Combine the aggregates of the fresh sensors."""
+        values = [
+            sensor.value
+            for sensor in self._sensors.values()
+            if sensor.value is not None
+            and (self._max_age is None or timestamp - sensor.timestamp <= self._max_age)
+        ]
+        if len(values) >= 3 and self._max_deviation is not None:
+            center = median(values)
+            values = [value for value in values if abs(value - center) <= self._max_deviation]
+        if not values:
+            self.value = None
+        elif len(values) == 1:
+            self.value = values[0]
+        elif self._method == AGGREGATION_MEDIAN:
+            self.value = median(values)
+        else:
+            self.value = fmean(values)
+        return self.value
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Return the aggregate of each sensor."""
+        return {entity_id: sensor.value for entity_id, sensor in self._sensors.items()}
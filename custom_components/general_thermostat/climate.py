@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Callable, Coroutine, Mapping
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import math
+from time import perf_counter
 from typing import Any, final
 
 from propcache.api import cached_property
@@ -24,50 +26,65 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ATTR_ENTITY_ID,
     ATTR_TEMPERATURE,
+    ATTR_TIME,
     CONF_ICON,
     CONF_NAME,
     CONF_UNIQUE_ID,
-    EVENT_HOMEASSISTANT_START,
     PRECISION_HALVES,
     PRECISION_TENTHS,
     PRECISION_WHOLE,
-    SERVICE_TURN_OFF,
-    SERVICE_TURN_ON,
+    STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
 from homeassistant.core import (
-    DOMAIN as HOMEASSISTANT_DOMAIN,
-    CoreState,
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
+    EventStateReportedData,
     HomeAssistant,
+    ServiceResponse,
     State,
+    SupportsResponse,
     callback,
 )
-from homeassistant.exceptions import ConditionError, ServiceValidationError
-from homeassistant.helpers import condition, config_validation as cv, entity_platform
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_platform,
+    issue_registry as ir,
+)
 from homeassistant.helpers.device import async_device_info_to_link_from_entity
 from homeassistant.helpers.entity_platform import (
     AddConfigEntryEntitiesCallback,
     AddEntitiesCallback,
 )
 from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
     async_track_state_change_event,
-    async_track_time_interval,
+    async_track_state_report_event,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, VolDictType
+from homeassistant.util import dt as dt_util
 
+from .actuator import ActuatorCommander
+from .aggregator import AGGREGATION_MEAN, AGGREGATIONS, SensorAggregator
 from .const import (
+    ATTR_ACTUATOR_COMMAND_RETRIES,
     ATTR_AUTO_UPDATE_PRESET_MODES,
     ATTR_COLD_TOLERANCE,
     ATTR_HOT_TOLERANCE,
     ATTR_PRESET_TEMPERATURES,
+    ATTR_RUNTIME,
+    ATTR_SCHEDULE_APPLIED,
+    ATTR_SENSOR_UPDATES,
+    ATTR_SUPPRESSED_ACTUATOR_COMMANDS,
+    ATTR_SUPPRESSED_STATE_WRITES,
+    ATTR_THERMAL_MODEL,
     CONF_AC_MODE,
     CONF_AUTO_UPDATE_PRESET_MODES,
     CONF_COLD_TOLERANCE,
@@ -77,23 +94,77 @@ from .const import (
     CONF_MIN_DUR,
     CONF_MIN_TEMP,
     CONF_PRESETS,
+    CONF_SCHEDULE,
     CONF_SENSOR,
     DEFAULT_TOLERANCE,
     DOMAIN,
+    SERVICE_DUMP_TRACE,
     SERVICE_SET_PRESET_TEMPERATURE,
     SERVICE_RESET_PRESET_TEMPERATURE,
+    SERVICE_SCHEDULE_PRESET_MODE,
     SERVICE_SET_TOLERANCE,
 )
+from .heat_source import HeatSource, async_get_heat_source, async_release_heat_source
+from .keep_alive import async_get_keep_alive_scheduler
+from .load_manager import LoadManager, async_get_load_manager
+from .metrics import ControlMetrics
+from .preset_table import PresetTable
+from .pwm import PwmController
+from .runtime import WINDOWS, RuntimeStats
+from .schedule import WeeklySchedule, weekly_schedule
+from .startup import async_get_startup_coordinator
+from .store import async_get_store
+from .thermal_model import ThermalModel
+from .trace import (
+    ACTION_EARLY_OFF,
+    ACTION_FAILSAFE_OFF,
+    ACTION_IDLE,
+    ACTION_KEEP_ALIVE_OFF,
+    ACTION_KEEP_ALIVE_ON,
+    ACTION_LOAD_SHED,
+    ACTION_MIN_CYCLE,
+    ACTION_TURN_OFF,
+    ACTION_TURN_ON,
+    DecisionTrace,
+)
+from .watchdog import SensorWatchdog, async_get_sensor_watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_PREHEAT_TIME = timedelta(hours=3)
 DEFAULT_NAME = "General Thermostat"
+DEFAULT_PWM_KI = 0.0
+DEFAULT_PWM_KP = 0.5
+DEFAULT_PWM_PERIOD = timedelta(minutes=15)
+
+CONF_CONTROL_MODE = "control_mode"
 
+CONF_HEAT_SOURCE = "heat_source"
+CONF_HEATER_POLICY = "heater_policy"
+CONF_HEATER_POWER = "heater_power"
 CONF_INITIAL_HVAC_MODE = "initial_hvac_mode"
 CONF_KEEP_ALIVE = "keep_alive"
+CONF_MAX_PREHEAT_TIME = "max_preheat_time"
 CONF_PRECISION = "precision"
+CONF_PWM_KI = "pwm_ki"
+CONF_PWM_KP = "pwm_kp"
+CONF_PWM_PERIOD = "pwm_period"
+CONF_SENSOR_AGGREGATION = "sensor_aggregation"
+CONF_SENSOR_MAX_AGE = "sensor_max_age"
+CONF_SENSOR_MAX_DEVIATION = "sensor_max_deviation"
+CONF_SENSOR_TIMEOUT = "sensor_timeout"
+CONF_SENSOR_TIMEOUT_DUTY_CYCLE = "sensor_timeout_duty_cycle"
+CONF_SENSOR_WINDOW = "sensor_window"
 CONF_TARGET_TEMP = "target_temp"
 CONF_TEMP_STEP = "target_temp_step"
+CONF_THERMAL_MODEL = "thermal_model"
+CONF_ZONES = "zones"
+
+CONTROL_MODE_HYSTERESIS = "hysteresis"
+CONTROL_MODE_PWM = "pwm"
+
+HEATER_POLICY_ALL = "all"
+HEATER_POLICY_ANY = "any"
 
 
 PRESETS_SCHEMA: VolDictType = {
@@ -102,8 +173,21 @@ PRESETS_SCHEMA: VolDictType = {
 
 PLATFORM_SCHEMA_COMMON = vol.Schema(
     {
-        vol.Required(CONF_HEATER): cv.entity_id,
-        vol.Required(CONF_SENSOR): cv.entity_id,
+        vol.Required(CONF_HEATER): cv.entity_ids,
+        vol.Optional(CONF_HEATER_POLICY, default=HEATER_POLICY_ANY): vol.In(
+            [HEATER_POLICY_ANY, HEATER_POLICY_ALL]
+        ),
+        vol.Optional(CONF_HEATER_POWER): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_HEAT_SOURCE): cv.entity_id,
+        vol.Required(CONF_SENSOR): cv.entity_ids,
+        vol.Optional(CONF_SENSOR_AGGREGATION, default=AGGREGATION_MEAN): vol.In(AGGREGATIONS),
+        vol.Optional(CONF_SENSOR_WINDOW): cv.positive_time_period,
+        vol.Optional(CONF_SENSOR_MAX_AGE): cv.positive_time_period,
+        vol.Optional(CONF_SENSOR_MAX_DEVIATION): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_SENSOR_TIMEOUT): cv.positive_time_period,
+        vol.Optional(CONF_SENSOR_TIMEOUT_DUTY_CYCLE, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=100)
+        ),
         vol.Optional(CONF_AC_MODE): cv.boolean,
         vol.Optional(CONF_AUTO_UPDATE_PRESET_MODES): vol.All(
             cv.ensure_list_csv, [vol.In(CONF_PRESETS.keys())]
@@ -116,6 +200,15 @@ PLATFORM_SCHEMA_COMMON = vol.Schema(
         vol.Optional(CONF_HOT_TOLERANCE): vol.Coerce(float),
         vol.Optional(CONF_TARGET_TEMP): vol.Coerce(float),
         vol.Optional(CONF_KEEP_ALIVE): cv.positive_time_period,
+        vol.Optional(CONF_CONTROL_MODE, default=CONTROL_MODE_HYSTERESIS): vol.In(
+            [CONTROL_MODE_HYSTERESIS, CONTROL_MODE_PWM]
+        ),
+        vol.Optional(CONF_PWM_PERIOD, default=DEFAULT_PWM_PERIOD): cv.positive_time_period,
+        vol.Optional(CONF_PWM_KP, default=DEFAULT_PWM_KP): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_PWM_KI, default=DEFAULT_PWM_KI): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_THERMAL_MODEL, default=False): cv.boolean,
+        vol.Optional(CONF_MAX_PREHEAT_TIME, default=DEFAULT_MAX_PREHEAT_TIME): cv.positive_time_period,
+        vol.Optional(CONF_SCHEDULE): weekly_schedule,
         vol.Optional(CONF_INITIAL_HVAC_MODE): vol.In(
             [HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF]
         ),
@@ -133,7 +226,34 @@ PLATFORM_SCHEMA_COMMON = vol.Schema(
 )
 
 
-PLATFORM_SCHEMA = CLIMATE_PLATFORM_SCHEMA.extend(PLATFORM_SCHEMA_COMMON.schema)
+PLATFORM_SCHEMA_SINGLE = CLIMATE_PLATFORM_SCHEMA.extend(PLATFORM_SCHEMA_COMMON.schema)
+
+
+def _validate_zones(config: dict[str, Any]) -> dict[str, Any]:
+    """Validate a single thermostat, or merge the common defaults into each zone and validate them."""
+    if (zones := config.get(CONF_ZONES)) is None:
+        return PLATFORM_SCHEMA_SINGLE(config)
+    platform_keys = {str(key) for key in CLIMATE_PLATFORM_SCHEMA.schema}
+    defaults = {
+        key: value for key, value in config.items() if key not in platform_keys and key != CONF_ZONES
+    }
+    if CONF_UNIQUE_ID in defaults:
+        raise vol.Invalid("unique_id must be set for each zone", path=[CONF_UNIQUE_ID])
+    return {
+        **{key: value for key, value in config.items() if key in platform_keys},
+        CONF_ZONES: vol.Schema([PLATFORM_SCHEMA_COMMON])(
+            [{**defaults, **zone} for zone in zones]
+        ),
+    }
+
+
+PLATFORM_SCHEMA = vol.All(
+    CLIMATE_PLATFORM_SCHEMA.extend(
+        {vol.Optional(CONF_ZONES): vol.All(cv.ensure_list, [dict])},
+        extra=vol.ALLOW_EXTRA,
+    ),
+    _validate_zones,
+)
 
 
 async def async_setup_entry(
@@ -142,12 +262,12 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Initialize config entry."""
-    await _async_setup_config(
+    thermostats = await _async_setup_config(
         hass,
-        PLATFORM_SCHEMA_COMMON(dict(config_entry.options)),
-        config_entry.entry_id,
+        [(PLATFORM_SCHEMA_COMMON(dict(config_entry.options)), config_entry.entry_id)],
         async_add_entities,
     )
+    config_entry.runtime_data = thermostats[0]
 
 
 async def async_setup_platform(
@@ -157,74 +277,125 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the general thermostat platform."""
+    zones = config[CONF_ZONES] if CONF_ZONES in config else [config]
     await _async_setup_config(
-        hass, config, config.get(CONF_UNIQUE_ID), async_add_entities
+        hass,
+        [(zone, zone.get(CONF_UNIQUE_ID)) for zone in zones],
+        async_add_entities,
     )
 
 
 async def _async_setup_config(
     hass: HomeAssistant,
-    config: Mapping[str, Any],
-    unique_id: str | None,
+    configs: list[tuple[Mapping[str, Any], str | None]],
     async_add_entities: AddEntitiesCallback | AddConfigEntryEntitiesCallback,
-) -> None:
+) -> list[GeneralThermostat]:
     """Set up the general thermostat platform."""
 
+    thermostats = [
+        _create_thermostat(hass, config, unique_id) for config, unique_id in configs
+    ]
+    async_add_entities(thermostats)
+
+    # The entity services are shared by all platforms of the integration, register them only once
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_TOLERANCE):
+        _async_register_entity_services()
+
+    return thermostats
+
+
+def _create_thermostat(
+    hass: HomeAssistant,
+    config: Mapping[str, Any],
+    unique_id: str | None,
+) -> GeneralThermostat:
+    """Create a general thermostat."""
+
     name: str = config[CONF_NAME]
-    heater_entity_id: str = config[CONF_HEATER]
-    sensor_entity_id: str = config[CONF_SENSOR]
+    heater_entity_ids: list[str] = config[CONF_HEATER]
+    heater_policy: str = config[CONF_HEATER_POLICY]
+    heater_power: float | None = config.get(CONF_HEATER_POWER)
+    heat_source_entity_id: str | None = config.get(CONF_HEAT_SOURCE)
+    sensor_entity_ids: list[str] = config[CONF_SENSOR]
+    sensor_timeout: timedelta | None = config.get(CONF_SENSOR_TIMEOUT)
+    sensor_timeout_duty_cycle: float = config[CONF_SENSOR_TIMEOUT_DUTY_CYCLE] / 100
+    sensor_aggregator = SensorAggregator(
+        sensor_entity_ids,
+        config[CONF_SENSOR_AGGREGATION],
+        config.get(CONF_SENSOR_WINDOW),
+        config.get(CONF_SENSOR_MAX_AGE),
+        config.get(CONF_SENSOR_MAX_DEVIATION),
+    )
     min_temp: float | None = config.get(CONF_MIN_TEMP)
     max_temp: float | None = config.get(CONF_MAX_TEMP)
     target_temp: float | None = config.get(CONF_TARGET_TEMP)
     ac_mode: bool | None = config.get(CONF_AC_MODE)
-    auto_update_preset_modes: list[str] | None = config.get(CONF_AUTO_UPDATE_PRESET_MODES)
     min_cycle_duration: timedelta | None = config.get(CONF_MIN_DUR)
     cold_tolerance: float | None = config.get(CONF_COLD_TOLERANCE)
     hot_tolerance: float | None = config.get(CONF_HOT_TOLERANCE)
     keep_alive: timedelta | None = config.get(CONF_KEEP_ALIVE)
+    pwm = (
+        PwmController(
+            config[CONF_PWM_PERIOD], config[CONF_PWM_KP], config[CONF_PWM_KI], min_cycle_duration
+        )
+        if config[CONF_CONTROL_MODE] == CONTROL_MODE_PWM
+        else None
+    )
+    # The fixed duty cycle after a sensor timeout is applied in PWM periods
+    stale_pwm = (
+        pwm or PwmController(config[CONF_PWM_PERIOD], 0.0, 0.0, min_cycle_duration)
+        if sensor_timeout_duty_cycle
+        else None
+    )
+    thermal_model = ThermalModel() if config[CONF_THERMAL_MODEL] else None
+    max_preheat_time: timedelta = config[CONF_MAX_PREHEAT_TIME]
+    schedule: WeeklySchedule | None = config.get(CONF_SCHEDULE) or None
     initial_hvac_mode: HVACMode | None = config.get(CONF_INITIAL_HVAC_MODE)
-    presets: dict[str, float] = {
-        key: config[value] for key, value in CONF_PRESETS.items() if value in config
-    }
+    presets = _get_presets(config)
+    auto_update_preset_modes = _get_auto_update_preset_modes(config, presets)
     precision: float | None = config.get(CONF_PRECISION)
     target_temperature_step: float | None = config.get(CONF_TEMP_STEP)
     unit = hass.config.units.temperature_unit
     icon: str | None = config.get(CONF_ICON)
 
-    if auto_update_preset_modes is not None:
-        if any(p not in presets.keys() for p in auto_update_preset_modes):
-            _LOGGER.error(
-                "Preset(s) in auto_update_preset_modes that are not valid preset(s) for this thermostat (there is no initial temperature defined for these preset(s)): %s",
-                ", ".join([p for p in auto_update_preset_modes if p not in presets.keys()]))
-            auto_update_preset_modes = [p for p in auto_update_preset_modes if p in presets.keys()]
-
-    async_add_entities(
-        [
-            GeneralThermostat(
-                hass,
-                name,
-                heater_entity_id,
-                sensor_entity_id,
-                min_temp,
-                max_temp,
-                target_temp,
-                ac_mode,
-                auto_update_preset_modes,
-                min_cycle_duration,
-                cold_tolerance,
-                hot_tolerance,
-                keep_alive,
-                initial_hvac_mode,
-                presets,
-                precision,
-                target_temperature_step,
-                unit,
-                unique_id,
-                icon,
-            )
-        ]
+    return GeneralThermostat(
+        hass,
+        name,
+        heater_entity_ids,
+        heater_policy,
+        heater_power,
+        heat_source_entity_id,
+        sensor_entity_ids,
+        sensor_aggregator,
+        sensor_timeout,
+        sensor_timeout_duty_cycle,
+        stale_pwm,
+        min_temp,
+        max_temp,
+        target_temp,
+        ac_mode,
+        auto_update_preset_modes,
+        min_cycle_duration,
+        cold_tolerance,
+        hot_tolerance,
+        keep_alive,
+        pwm,
+        thermal_model,
+        max_preheat_time,
+        schedule,
+        initial_hvac_mode,
+        presets,
+        precision,
+        target_temperature_step,
+        unit,
+        unique_id,
+        icon,
     )
 
+
+@callback
+def _async_register_entity_services() -> None:
+    """Register the entity services."""
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
@@ -256,6 +427,42 @@ async def _async_setup_config(
         [ClimateEntityFeature.TARGET_TEMPERATURE],
     )
 
+    platform.async_register_entity_service(
+        SERVICE_SCHEDULE_PRESET_MODE,
+        {
+            vol.Required(ATTR_PRESET_MODE): cv.string,
+            vol.Required(ATTR_TIME): cv.datetime,
+        },
+        "async_handle_schedule_preset_mode_service",
+        [ClimateEntityFeature.PRESET_MODE],
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_DUMP_TRACE,
+        None,
+        "async_handle_dump_trace_service",
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _get_presets(config: Mapping[str, Any]) -> dict[str, float]:
+    """Return the configured preset temperatures."""
+    return {
+        key: config[value] for key, value in CONF_PRESETS.items() if value in config
+    }
+
+
+def _get_auto_update_preset_modes(config: Mapping[str, Any], presets: dict[str, float]) -> list[str] | None:
+    """Return the configured auto updated preset modes that are valid for the presets."""
+    auto_update_preset_modes: list[str] | None = config.get(CONF_AUTO_UPDATE_PRESET_MODES)
+    if auto_update_preset_modes is not None:
+        if any(p not in presets.keys() for p in auto_update_preset_modes):
+            _LOGGER.error(
+                "Preset(s) in auto_update_preset_modes that are not valid preset(s) for this thermostat (there is no initial temperature defined for these preset(s)): %s",
+                ", ".join([p for p in auto_update_preset_modes if p not in presets.keys()]))
+            auto_update_preset_modes = [p for p in auto_update_preset_modes if p in presets.keys()]
+    return auto_update_preset_modes
+
 
 CACHED_PROPERTIES_WITH_ATTR_ = {
     ATTR_AUTO_UPDATE_PRESET_MODES,
@@ -274,21 +481,40 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
 
     _attr_should_poll = False
     _attr_translation_key = "general_thermostat"
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_ACTUATOR_COMMAND_RETRIES,
+            ATTR_AUTO_UPDATE_PRESET_MODES,
+            ATTR_PRESET_TEMPERATURES,
+            ATTR_SENSOR_UPDATES,
+            ATTR_SUPPRESSED_ACTUATOR_COMMANDS,
+            ATTR_SUPPRESSED_STATE_WRITES,
+        }
+    )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return entity specific state attributes."""
-        supported_features = self.supported_features
-
-        data = {
-            ATTR_COLD_TOLERANCE: self.cold_tolerance,
-            ATTR_HOT_TOLERANCE: self.hot_tolerance,
-        }
-
-        if ClimateEntityFeature.PRESET_MODE in supported_features:
-            data[ATTR_AUTO_UPDATE_PRESET_MODES] = self.auto_update_preset_modes
-            data[ATTR_PRESET_TEMPERATURES] = self.preset_temperatures
+        """Return entity specific state attributes.
 
+        The mapping is cached until the tolerances or the presets change, only the counters
+        are updated in it. The state machine copies it on each write.
+        """
+        if (data := self._extra_state_attributes_cache) is None:
+            data = {
+                ATTR_COLD_TOLERANCE: self.cold_tolerance,
+                ATTR_HOT_TOLERANCE: self.hot_tolerance,
+            }
+
+            if ClimateEntityFeature.PRESET_MODE in self.supported_features:
+                data[ATTR_AUTO_UPDATE_PRESET_MODES] = self.auto_update_preset_modes
+                data[ATTR_PRESET_TEMPERATURES] = self.preset_temperatures
+
+            self._extra_state_attributes_cache = data
+
+        data[ATTR_SENSOR_UPDATES] = self._sensor_updates
+        data[ATTR_SUPPRESSED_STATE_WRITES] = self._suppressed_state_writes
+        data[ATTR_SUPPRESSED_ACTUATOR_COMMANDS] = self._actuator.duplicates
+        data[ATTR_ACTUATOR_COMMAND_RETRIES] = self._actuator.retries
         return data
 
     @cached_property
@@ -321,8 +547,15 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         self,
         hass: HomeAssistant,
         name: str,
-        heater_entity_id: str,
-        sensor_entity_id: str,
+        heater_entity_ids: list[str],
+        heater_policy: str,
+        heater_power: float | None,
+        heat_source_entity_id: str | None,
+        sensor_entity_ids: list[str],
+        sensor_aggregator: SensorAggregator,
+        sensor_timeout: timedelta | None,
+        sensor_timeout_duty_cycle: float,
+        stale_pwm: PwmController | None,
         min_temp: float | None,
         max_temp: float | None,
         target_temp: float | None,
@@ -332,6 +565,10 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         cold_tolerance: float | None,
         hot_tolerance: float | None,
         keep_alive: timedelta | None,
+        pwm: PwmController | None,
+        thermal_model: ThermalModel | None,
+        max_preheat_time: timedelta,
+        schedule: WeeklySchedule | None,
         initial_hvac_mode: HVACMode | None,
         presets: dict[str, float],
         precision: float | None,
@@ -342,27 +579,71 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
     ) -> None:
         """Initialize the thermostat."""
         self._attr_name = name
-        self.heater_entity_id = heater_entity_id
-        self.sensor_entity_id = sensor_entity_id
+        self._extra_state_attributes_cache: dict[str, Any] | None = None
+        self.heater_entity_ids = heater_entity_ids
+        self._heater_policy = heater_policy
+        self._heat_source_entity_id = heat_source_entity_id
+        self._heat_source: HeatSource | None = None
+        self._heater_power = heater_power or 0.0
+        self._load_manager: LoadManager | None = None
+        self.metrics = ControlMetrics()
+        self.runtime_stats = RuntimeStats(dt_util.utcnow().timestamp())
+        self._trace = DecisionTrace()
+        self._actuator = ActuatorCommander(hass, heater_entity_ids, self.metrics)
+        self._store = async_get_store(hass)
+        self.sensor_entity_ids = sensor_entity_ids
+        self._sensors = sensor_aggregator
+        self._sensor_timeout = sensor_timeout
+        self._sensor_timeout_duty_cycle = sensor_timeout_duty_cycle
+        self._sensor_watchdog: SensorWatchdog | None = None
+        self._sensor_stale = False
+        self._stale_pwm = stale_pwm
         self._attr_device_info = async_device_info_to_link_from_entity(
             hass,
-            heater_entity_id,
+            heater_entity_ids[0],
         )
         self.ac_mode = ac_mode
         self.min_cycle_duration = min_cycle_duration
         self._attr_cold_tolerance = abs(cold_tolerance) if cold_tolerance is not None else None
         self._attr_hot_tolerance = abs(hot_tolerance) if hot_tolerance is not None else None
         self._keep_alive = keep_alive
+        self._remove_keep_alive: CALLBACK_TYPE | None = None
+        self._pwm = pwm
+        self._pwm_on = False
+        self._remove_pwm_period: CALLBACK_TYPE | None = None
+        self._remove_pwm_off: CALLBACK_TYPE | None = None
+        self._thermal_model = thermal_model
+        self._max_preheat_time = max_preheat_time
+        self._scheduled_preset: tuple[str, datetime] | None = None
+        self._remove_scheduled_preset: CALLBACK_TYPE | None = None
+        self._schedule = schedule
+        self._schedule_next: tuple[str, datetime] | None = None
+        self._schedule_applied: datetime | None = None
         self._attr_hvac_mode = initial_hvac_mode
         if precision is not None:
             self._attr_precision = precision
-        self._attr_target_temperature_step = target_temperature_step or self.precision
+        self._target_temperature_step = target_temperature_step
         if self.ac_mode:
             self._attr_hvac_modes = [HVACMode.COOL, HVACMode.OFF]
         else:
             self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
         self._active = False
-        self._temp_lock = asyncio.Lock()
+        self._startup_pending = False
+        self._control_running = False
+        self._control_rerun: asyncio.Future[None] | None = None
+        self._control_time: datetime | None = None
+        self._control_force = False
+        self._control_waiting_since: float | None = None
+        self._last_written_current_temperature: float | None = None
+        self._last_written_hvac_action: HVACAction | None = None
+        self._sensor_updates = 0
+        self._suppressed_state_writes = 0
+        self._heater_active: bool | None = None
+        self._heater_last_changed: datetime | None = None
+        self._min_threshold: float | None = None
+        self._max_threshold: float | None = None
+        self._min_cycle_recheck_at: datetime | None = None
+        self._remove_min_cycle_recheck: CALLBACK_TYPE | None = None
         if min_temp is not None:
             self._attr_min_temp = min_temp
         if max_temp is not None:
@@ -380,11 +661,13 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         self._attr_auto_update_preset_modes = auto_update_preset_modes if auto_update_preset_modes is not None else list(presets.keys())
         if len(presets):
             self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
-            self._attr_preset_modes = [PRESET_NONE, *presets.keys()]
-            self._attr_preset_temperatures = [target_temp, *presets.values()]
-        else:
-            self._attr_preset_modes = [PRESET_NONE]
-            self._attr_preset_temperatures = [target_temp]
+        self._preset_table = PresetTable(
+            [PRESET_NONE, *presets.keys()],
+            [target_temp, *presets.values()],
+            self._attr_auto_update_preset_modes,
+        )
+        self._attr_preset_modes = self._preset_table.modes
+        self._attr_preset_temperatures = self._preset_table.temperatures
         self._presets = presets
 
     async def async_added_to_hass(self) -> None:
@@ -394,26 +677,89 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         # Add listener
         self.async_on_remove(
             async_track_state_change_event(
-                self.hass, [self.sensor_entity_id], self._async_sensor_changed
+                self.hass, self.sensor_entity_ids, self._async_sensor_changed
             )
         )
         self.async_on_remove(
             async_track_state_change_event(
-                self.hass, [self.heater_entity_id], self._async_switch_changed
+                self.hass, self.heater_entity_ids, self._async_switch_changed
             )
         )
 
-        if self._keep_alive:
+        self._async_register_keep_alive()
+        self.async_on_remove(self._async_unregister_keep_alive)
+
+        if (load_manager := async_get_load_manager(self.hass)) is not None:
+            self._load_manager = load_manager
+            self.async_on_remove(partial(load_manager.async_release, self.entity_id))
+        self._async_update_heater_state()
+        self.async_on_remove(self._async_cancel_min_cycle_recheck)
+        self.async_on_remove(self._async_stop_pwm)
+        self.async_on_remove(self._async_cancel_scheduled_preset)
+        if self._sensor_timeout is not None:
+            self._sensor_watchdog = async_get_sensor_watchdog(self.hass)
+            self.async_on_remove(
+                self._sensor_watchdog.async_register(
+                    self.entity_id, self._sensor_timeout, self._async_sensor_timed_out
+                )
+            )
+            self.async_on_remove(
+                partial(ir.async_delete_issue, self.hass, DOMAIN, self._stale_issue_id)
+            )
+        if self._sensor_timeout is not None or self._sensors.max_age is not None:
+            # A sensor reporting an unchanged temperature fires state_reported only, it is
+            # a fresh reading for the watchdog and for the sensor_max_age of the aggregate
+            self.async_on_remove(
+                async_track_state_report_event(
+                    self.hass, self.sensor_entity_ids, self._async_sensor_reported
+                )
+            )
+        if self._heat_source_entity_id is not None:
+            self._heat_source = async_get_heat_source(
+                self.hass, self._heat_source_entity_id, self.entity_id
+            )
             self.async_on_remove(
-                async_track_time_interval(
-                    self.hass, self._async_control_heating, self._keep_alive
+                partial(
+                    async_release_heat_source,
+                    self.hass,
+                    self._heat_source_entity_id,
+                    self.entity_id,
                 )
             )
+        self.async_on_remove(self._actuator.async_cancel)
 
         new_preset_temperatures = self._attr_preset_temperatures.copy()
 
-        # Check If we have an old state
-        if (old_state := await self.async_get_last_state()) is not None:
+        old_state = await self.async_get_last_state()
+
+        # Check If we have stored data, or fall back to the old state's attributes
+        if (self.unique_id is not None
+            and (stored := self._store.async_get(self.unique_id)) is not None
+        ):
+            if (self._attr_target_temperature is None
+                and (old_attr := stored.get(ATTR_TEMPERATURE)) is not None
+            ):
+                self._attr_target_temperature = float(old_attr)
+            if (self._attr_cold_tolerance is None
+                and (old_attr := stored.get(ATTR_COLD_TOLERANCE)) is not None
+            ):
+                self._attr_cold_tolerance = abs(float(old_attr))
+            if (self._attr_hot_tolerance is None
+                and (old_attr := stored.get(ATTR_HOT_TOLERANCE)) is not None
+            ):
+                self._attr_hot_tolerance = abs(float(old_attr))
+            if stored.get(ATTR_PRESET_MODE) in self._preset_table:
+                self._attr_preset_mode = stored[ATTR_PRESET_MODE]
+            for mode, temp in stored.get(ATTR_PRESET_TEMPERATURES, {}).items():
+                if mode in self._preset_table and temp:
+                    new_preset_temperatures[self._preset_table.index(mode)] = float(temp)
+            if self._thermal_model is not None and (model := stored.get(ATTR_THERMAL_MODEL)):
+                self._thermal_model.load(model)
+            if (applied := stored.get(ATTR_SCHEDULE_APPLIED)) is not None:
+                self._schedule_applied = dt_util.parse_datetime(applied)
+            if (runtime := stored.get(ATTR_RUNTIME)) is not None:
+                self.runtime_stats.load(runtime)
+        elif old_state is not None:
             if (self._attr_target_temperature is None
                 and (old_attr := old_state.attributes.get(ATTR_TEMPERATURE)) is not None
             ):
@@ -436,10 +782,10 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
                 and (old_preset_temperatures := old_state.attributes.get(ATTR_PRESET_TEMPERATURES)) is not None
             ):
                 for mode, temp in zip(old_preset_modes, old_preset_temperatures):
-                    if mode in self._attr_preset_modes and temp:
-                        new_preset_temperatures[self._attr_preset_modes.index(mode)] = float(temp)
-            if not self._attr_hvac_mode and old_state.state:
-                self._attr_hvac_mode = HVACMode(old_state.state)
+                    if mode in self._preset_table and temp:
+                        new_preset_temperatures[self._preset_table.index(mode)] = float(temp)
+        if old_state is not None and not self._attr_hvac_mode and old_state.state:
+            self._attr_hvac_mode = HVACMode(old_state.state)
 
         # No previous state, try and restore defaults
         if self._attr_target_temperature is None:
@@ -461,7 +807,7 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
                 "No previously saved hot tolerance, setting to %f", self._attr_hot_tolerance
             )
 
-        new_preset_temperatures[self._attr_preset_modes.index(self._attr_preset_mode)] = self._attr_target_temperature
+        new_preset_temperatures[self._preset_table.index(self._attr_preset_mode)] = self._attr_target_temperature
         if not new_preset_temperatures[0]:
             new_preset_temperatures[0] = self.max_temp if self.ac_mode else self.min_temp
             _LOGGER.warning(
@@ -469,47 +815,133 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
             )
 
         # Attribute setting is required by @cached_property
-        if new_preset_temperatures != self._attr_preset_temperatures:
-            self._attr_preset_temperatures = new_preset_temperatures
+        if self._preset_table.set_temperatures(new_preset_temperatures):
+            self._attr_preset_temperatures = self._preset_table.temperatures
+        self._extra_state_attributes_cache = None
 
         # Set default state to off
         if not self._attr_hvac_mode:
             self._attr_hvac_mode = HVACMode.OFF
 
+        self._update_thresholds()
+        self.runtime_stats.switched(
+            self._heater_active is True, dt_util.utcnow().timestamp(), transition=False
+        )
+        self._async_save_runtime_data()
+        self._async_start_schedule()
+
         @callback
-        def _async_startup(_: Event | None = None) -> None:
-            """Init on startup."""
-            sensor_state = self.hass.states.get(self.sensor_entity_id)
-            if sensor_state and sensor_state.state not in (
-                STATE_UNAVAILABLE,
-                STATE_UNKNOWN,
-            ):
-                self._async_update_temp(sensor_state)
+        def _async_startup() -> Callable[[], Coroutine[Any, Any, None]] | None:
+            """Init on startup, return the initial switch state check to run."""
+            self._startup_pending = False
+            for sensor_entity_id in self.sensor_entity_ids:
+                sensor_state = self.hass.states.get(sensor_entity_id)
+                if sensor_state and sensor_state.state not in (
+                    STATE_UNAVAILABLE,
+                    STATE_UNKNOWN,
+                ):
+                    self._async_update_temp(sensor_state)
+            if self._attr_current_temperature is not None:
                 self.async_write_ha_state()
-            switch_state = self.hass.states.get(self.heater_entity_id)
-            if switch_state and switch_state.state not in (
-                STATE_UNAVAILABLE,
-                STATE_UNKNOWN,
-            ):
-                self.hass.async_create_task(
-                    self._check_switch_initial_state(), eager_start=True
-                )
+                # Recompute the optimum start with the current temperature
+                self._async_arm_scheduled_preset()
+            for heater_entity_id in self.heater_entity_ids:
+                switch_state = self.hass.states.get(heater_entity_id)
+                if switch_state and switch_state.state not in (
+                    STATE_UNAVAILABLE,
+                    STATE_UNKNOWN,
+                ):
+                    return self._check_switch_initial_state
+            return None
 
-        if self.hass.state is CoreState.running:
-            _async_startup()
-        else:
-            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, _async_startup)
+        # The startup is coordinated with the other thermostats to not flood the actuators
+        self._startup_pending = True
+        self.async_on_remove(
+            async_get_startup_coordinator(self.hass).async_add(_async_startup)
+        )
+
+    @callback
+    def _async_start_schedule(self) -> None:
+        """Arm the next transition of the weekly schedule.
+
+        The last transition is applied first, if it was missed, eg. while Home Assistant
+        was stopped.
+        """
+        self._schedule_next = None
+        if self._schedule:
+            now = dt_util.utcnow()
+            at, preset_mode = self._schedule.last_transition(now)
+            if self._schedule_applied is not None and self._schedule_applied >= at:
+                at, preset_mode = self._schedule.next_transition(now)
+            self._schedule_next = (preset_mode, at)
+        self._async_arm_scheduled_preset()
+
+    @callback
+    def _async_register_keep_alive(self) -> None:
+        """Register the keep-alive with the shared scheduler."""
+        if self._keep_alive:
+            self._remove_keep_alive = async_get_keep_alive_scheduler(self.hass).async_register(
+                self.entity_id, self._keep_alive, self._async_control_heating
+            )
+
+    @callback
+    def _async_unregister_keep_alive(self) -> None:
+        """Unregister the keep-alive from the shared scheduler."""
+        if self._remove_keep_alive is not None:
+            self._remove_keep_alive()
+            self._remove_keep_alive = None
+
+    @callback
+    def _async_save_runtime_data(self) -> None:
+        """Schedule saving the runtime mutable data to the store."""
+        if self.unique_id is not None:
+            self._store.async_schedule_save(self.unique_id, self._runtime_data)
+
+    def _runtime_data(self) -> dict[str, Any]:
+        """Return the runtime mutable data to store."""
+        return {
+            ATTR_TEMPERATURE: self._attr_target_temperature,
+            ATTR_COLD_TOLERANCE: self._attr_cold_tolerance,
+            ATTR_HOT_TOLERANCE: self._attr_hot_tolerance,
+            ATTR_PRESET_MODE: self._attr_preset_mode,
+            ATTR_PRESET_TEMPERATURES: dict(
+                zip(self._preset_table.modes, self._preset_table.temperatures)
+            ),
+            ATTR_THERMAL_MODEL: None if self._thermal_model is None else self._thermal_model.as_dict(),
+            ATTR_SCHEDULE_APPLIED: None
+            if self._schedule_applied is None
+            else self._schedule_applied.isoformat(),
+            ATTR_RUNTIME: self.runtime_stats.as_dict(dt_util.utcnow().timestamp()),
+        }
 
     def _set_attr_preset_mode_based_on_target_temp(self) -> None:
-        presets_inv = {v: k for v, k in zip(self._attr_preset_temperatures, self._attr_preset_modes) if k != PRESET_NONE and k not in self._attr_auto_update_preset_modes}
-        self._attr_preset_mode = presets_inv.get(self._attr_target_temperature, PRESET_NONE)
+        self._attr_preset_mode = self._preset_table.preset_for_temperature(self._attr_target_temperature)
 
     def _set_attr_preset_temperatures(self, preset_mode: str, temperature: float) -> None:
-        index = self._attr_preset_modes.index(preset_mode)
-        if self._attr_preset_temperatures[index] != temperature:
-            new_preset_temperatures = self._attr_preset_temperatures.copy()
-            new_preset_temperatures[index] = temperature
-            self._attr_preset_temperatures = new_preset_temperatures
+        # Attribute setting is required by @cached_property
+        if self._preset_table.set_temperature(preset_mode, temperature):
+            self._attr_preset_temperatures = self._preset_table.temperatures
+            self._extra_state_attributes_cache = None
+
+    @property
+    def _cached_hvac_action(self) -> HVACAction:
+        """Return the hvac_action of the cached heater state."""
+        if self._attr_hvac_mode == HVACMode.OFF:
+            return HVACAction.OFF
+        if not self._heater_active:
+            return HVACAction.IDLE
+        if self.ac_mode:
+            return HVACAction.COOLING
+        return HVACAction.HEATING
+
+    @property
+    def target_temperature_step(self) -> float:
+        """Return the supported step of target temperature, the precision by default.
+
+        The default precision depends on the unit system, it can't be read before the
+        entity is added to hass.
+        """
+        return self._target_temperature_step or self.precision
 
     @property
     def hvac_action(self) -> HVACAction:
@@ -529,13 +961,21 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         """Set hvac mode."""
         if hvac_mode == HVACMode.HEAT:
             self._attr_hvac_mode = HVACMode.HEAT
+            self._async_raise_stale_issue()
             await self._async_control_heating(force=True)
         elif hvac_mode == HVACMode.COOL:
             self._attr_hvac_mode = HVACMode.COOL
+            self._async_raise_stale_issue()
             await self._async_control_heating(force=True)
         elif hvac_mode == HVACMode.OFF:
             self._attr_hvac_mode = HVACMode.OFF
+            self._async_stop_pwm()
+            if self._sensor_stale:
+                ir.async_delete_issue(self.hass, DOMAIN, self._stale_issue_id)
+            if self._load_manager is not None and not self._is_device_active:
+                self._load_manager.async_release(self.entity_id)
             if self._is_device_active:
+                self._trace_decision(ACTION_TURN_OFF, True, True, False)
                 await self._async_heater_turn_off()
         else:
             _LOGGER.error("Unrecognized hvac mode: %s", hvac_mode)
@@ -557,19 +997,202 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
             preset_mode_to_update_its_temperature = PRESET_NONE
             self._set_attr_preset_mode_based_on_target_temp()
         self._set_attr_preset_temperatures(preset_mode_to_update_its_temperature, temperature)
+        self._update_thresholds()
+        self._async_save_runtime_data()
         await self._async_control_heating(force=True)
         self.async_write_ha_state()
 
-    async def _async_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
+    async def _async_sensor_changed(
+        self, event: Event[EventStateChangedData] | Event[EventStateReportedData]
+    ) -> None:
         """Handle temperature changes."""
         new_state = event.data["new_state"]
         if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._sensors.discard(event.data["entity_id"])
             return
 
-        self._async_update_temp(new_state)
-        await self._async_control_heating()
+        self._sensor_updates += 1
+        if (temperature := self._async_aggregate_temp(new_state)) is None:
+            return
+        if self._thermal_model is not None and self._thermal_model.observe(
+            self._model_temperature(temperature),
+            new_state.last_reported_timestamp,
+            self._heater_active is True,
+        ):
+            self._async_save_runtime_data()
+        if self._sensor_watchdog is not None:
+            self._sensor_watchdog.async_feed(self.entity_id)
+            if self._sensor_stale:
+                self._async_sensor_recovered()
+                self._attr_current_temperature = temperature
+                await self._async_control_heating(force=True)
+                self.async_write_ha_state()
+                return
+        self._attr_current_temperature = temperature
+        if not self._is_in_dead_band():
+            await self._async_control_heating()
+        elif (self._load_manager is not None
+            and self._heater_active is False
+            and not self._pwm_on
+            and self._actuator.pending is not True
+        ):
+            # The heater stays off, a capacity request left from a load shed is withdrawn
+            self._load_manager.async_release(self.entity_id)
+        if self._is_temperature_update_redundant(temperature):
+            self._suppressed_state_writes += 1
+            return
         self.async_write_ha_state()
 
+    @property
+    def _stale_issue_id(self) -> str:
+        """Return the id of the repair issue raised when the sensors time out."""
+        return f"sensor_timeout_{self.entity_id}"
+
+    @callback
+    def _async_sensor_reported(self, event: Event[EventStateReportedData]) -> None:
+        """Handle a sensor reporting its unchanged temperature like a new reading."""
+        self.hass.async_create_task(self._async_sensor_changed(event), eager_start=True)
+
+    @callback
+    def _async_sensor_timed_out(self) -> None:
+        """Fall back to the fail-safe action, the sensors didn't report within sensor_timeout.
+
+        While the thermostat is off there is nothing to fail safe, the issue is raised when
+        it is turned on with the sensors still silent.
+        """
+        self._sensor_stale = True
+        if self._attr_hvac_mode == HVACMode.OFF:
+            _LOGGER.info(
+                "%s: no temperature from %s for %s",
+                self.entity_id,
+                ", ".join(self.sensor_entity_ids),
+                self._sensor_timeout,
+            )
+            return
+        self._async_raise_stale_issue()
+        self.hass.async_create_task(self._async_force_control(), eager_start=True)
+
+    @callback
+    def _async_raise_stale_issue(self) -> None:
+        """Warn that the thermostat runs its fail-safe action, if the sensors timed out."""
+        if not self._sensor_stale:
+            return
+        _LOGGER.warning(
+            "%s: no temperature from %s for %s, %s",
+            self.entity_id,
+            ", ".join(self.sensor_entity_ids),
+            self._sensor_timeout,
+            "turning off the heater"
+            if self._stale_pwm is None
+            else f"running the heater at {self._sensor_timeout_duty_cycle:.0%}",
+        )
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            self._stale_issue_id,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key="sensor_timeout",
+            translation_placeholders={
+                "entity_id": self.entity_id,
+                "sensors": ", ".join(self.sensor_entity_ids),
+                "timeout": str(self._sensor_timeout),
+            },
+        )
+
+    @callback
+    def _async_sensor_recovered(self) -> None:
+        """Leave the fail-safe action, the sensors report again."""
+        _LOGGER.info("%s: temperature received again", self.entity_id)
+        self._sensor_stale = False
+        ir.async_delete_issue(self.hass, DOMAIN, self._stale_issue_id)
+        if self._pwm is None:
+            self._async_cancel_pwm_timers()
+            self._pwm_on = False
+
+    async def _async_force_control(self) -> None:
+        """Re-evaluate the control ignoring min_cycle_duration."""
+        await self._async_control_heating(force=True)
+        self.async_write_ha_state()
+
+    @callback
+    def _is_temperature_update_redundant(self, temperature: float) -> bool:
+        """Return True if the new temperature would not change the visible state.
+
+        The temperature is quantized to the entity's precision and compared with the last
+        written temperature, and the hvac_action of the cached heater state is compared with
+        the one that was last written, so the state machine is not read. The control always
+        runs on the raw temperature, only the write is skipped.
+        """
+        if self._last_written_current_temperature is None:
+            return False
+        return (
+            self._quantize_temperature(temperature)
+            == self._quantize_temperature(self._last_written_current_temperature)
+            and self._cached_hvac_action == self._last_written_hvac_action
+        )
+
+    def _update_thresholds(self) -> None:
+        """Precompute the control thresholds from the target temperature and the tolerances."""
+        if None in (
+            self._attr_target_temperature,
+            self._attr_cold_tolerance,
+            self._attr_hot_tolerance,
+        ):
+            self._min_threshold = self._max_threshold = None
+            return
+        self._min_threshold = self._attr_target_temperature - self._attr_cold_tolerance
+        self._max_threshold = self._attr_target_temperature + self._attr_hot_tolerance
+
+    def _is_in_dead_band(self) -> bool:
+        """Return True if the current temperature can't switch the heater in its cached state."""
+        if not self._active or self._attr_current_temperature is None:
+            return False
+        if self._attr_hvac_mode == HVACMode.OFF:
+            return True
+        if self._pwm is not None:
+            # The heater is switched only by the PWM timers
+            return True
+        if self._heater_active is None or self._min_threshold is None or self._max_threshold is None:
+            return False
+        if self._heater_active:
+            overshoot = self._expected_overshoot()
+            if self.ac_mode:
+                return self._attr_current_temperature > self._min_threshold + overshoot
+            return self._attr_current_temperature < self._max_threshold - overshoot
+        if self.ac_mode:
+            return self._attr_current_temperature <= self._max_threshold
+        return self._attr_current_temperature >= self._min_threshold
+
+    def _expected_overshoot(self) -> float:
+        """Return the learned overshoot after a switch off, at most the width of the dead band."""
+        if self._thermal_model is None or self._min_threshold is None or self._max_threshold is None:
+            return 0.0
+        return min(self._thermal_model.overshoot, self._max_threshold - self._min_threshold)
+
+    def _model_temperature(self, temperature: float) -> float:
+        """Return the temperature in the direction of the heater, as seen by the thermal model."""
+        return -temperature if self.ac_mode else temperature
+
+    def _quantize_temperature(self, temperature: float) -> float:
+        """Round the temperature to the entity's precision."""
+        return round(temperature / self.precision) * self.precision
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and remember the visible values.
+
+        The heat source is notified when the hvac_action changes.
+        """
+        hvac_action = self.hvac_action
+        if self._heat_source is not None and hvac_action != self._last_written_hvac_action:
+            self._heat_source.async_set_demand(
+                self.entity_id, hvac_action in (HVACAction.HEATING, HVACAction.COOLING)
+            )
+        self._last_written_current_temperature = self._attr_current_temperature
+        self._last_written_hvac_action = hvac_action
+        super().async_write_ha_state()
+
     async def _check_switch_initial_state(self) -> None:
         """Prevent the device from keep running if HVACMode.OFF or update heater switch state if not HVACMode.OFF."""
         if self._attr_hvac_mode == HVACMode.OFF:
@@ -579,8 +1202,9 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
                         "The climate mode is OFF, but the switch device is ON. Turning off"
                         " device %s"
                     ),
-                    self.heater_entity_id,
+                    ", ".join(self.heater_entity_ids),
                 )
+                self._trace_decision(ACTION_TURN_OFF, True, True, False)
                 await self._async_heater_turn_off()
         else:
             await self._async_control_heating(force=True)
@@ -593,123 +1217,426 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         old_state = event.data["old_state"]
         if new_state is None:
             return
-        if old_state is None:
-            self.hass.async_create_task(
-                self._check_switch_initial_state(), eager_start=True
+        self._actuator.async_state_changed(new_state)
+        was_active = self._heater_active
+        self._async_update_heater_state(new_state)
+        if self._heater_active is not None and self._heater_active != was_active:
+            self.runtime_stats.switched(
+                self._heater_active,
+                new_state.last_changed_timestamp,
+                transition=was_active is not None,
+            )
+            self._async_save_runtime_data()
+        if self.min_cycle_duration and self._heater_last_changed is not None:
+            self._async_schedule_min_cycle_recheck()
+        if old_state is None and not self._startup_pending:
+            # A heater added after the startup is checked in the rate limited queue as well,
+            # before the startup its state is read by the coordinated startup
+            self.async_on_remove(
+                async_get_startup_coordinator(self.hass).async_add(
+                    lambda: self._check_switch_initial_state
+                )
+            )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_update_heater_state(self, changed: State | None = None) -> None:
+        """Remember the heater state and when it was last switched on or off.
+
+        With several heaters, the group is switched when its state under the heater policy
+        changes, initially the latest switch of the members is used.
+        """
+        heater_active = self._is_device_active
+        states = [
+            state
+            for entity_id in self.heater_entity_ids
+            if (state := self.hass.states.get(entity_id)) is not None
+            and state.state in (STATE_ON, STATE_OFF)
+        ]
+        if not states:
+            self._heater_last_changed = None
+        elif changed is None:
+            self._heater_last_changed = max(state.last_changed for state in states)
+        elif (
+            (self._heater_last_changed is None or heater_active != self._heater_active)
+            and changed.state in (STATE_ON, STATE_OFF)
+        ):
+            self._heater_last_changed = changed.last_changed
+        if (
+            self._thermal_model is not None
+            and changed is not None
+            and heater_active is not None
+            and self._heater_active is not None
+            and heater_active != self._heater_active
+        ):
+            self._thermal_model.heater_switched(
+                heater_active,
+                None
+                if self._attr_current_temperature is None
+                else self._model_temperature(self._attr_current_temperature),
+                changed.last_changed_timestamp,
             )
+        self._heater_active = heater_active
+        if self._load_manager is not None:
+            if heater_active:
+                self._load_manager.async_set_active(self.entity_id, self._heater_power)
+            elif heater_active is False and self._actuator.pending is not True:
+                self._load_manager.async_release(self.entity_id)
+
+    def _is_min_cycle_long_enough(self) -> bool:
+        """Return True if the heater is in its current state for at least min_cycle_duration."""
+        assert self.min_cycle_duration is not None
+        if self._heater_last_changed is None:
+            return False
+        return dt_util.utcnow() - self._heater_last_changed >= self.min_cycle_duration
+
+    @callback
+    def _async_schedule_min_cycle_recheck(self) -> None:
+        """Re-evaluate the control when the current heater cycle reaches min_cycle_duration."""
+        assert self.min_cycle_duration is not None and self._heater_last_changed is not None
+        recheck_at = self._heater_last_changed + self.min_cycle_duration
+        if self._remove_min_cycle_recheck is not None:
+            if recheck_at == self._min_cycle_recheck_at:
+                return
+            self._remove_min_cycle_recheck()
+        self._min_cycle_recheck_at = recheck_at
+        self._remove_min_cycle_recheck = async_track_point_in_utc_time(
+            self.hass, self._async_min_cycle_expired, recheck_at
+        )
+
+    @callback
+    def _async_cancel_min_cycle_recheck(self) -> None:
+        """Cancel the scheduled min_cycle_duration re-check."""
+        if self._remove_min_cycle_recheck is not None:
+            self._remove_min_cycle_recheck()
+            self._remove_min_cycle_recheck = None
+            self._min_cycle_recheck_at = None
+
+    async def _async_min_cycle_expired(self, _: datetime) -> None:
+        """Re-evaluate the control after the min_cycle_duration expired."""
+        self._remove_min_cycle_recheck = None
+        self._min_cycle_recheck_at = None
+        await self._async_control_heating()
         self.async_write_ha_state()
 
     @callback
     def _async_update_temp(self, state: State) -> None:
         """Update thermostat with latest state from sensor."""
+        if (temperature := self._async_aggregate_temp(state)) is not None:
+            self._attr_current_temperature = temperature
+
+    @callback
+    def _async_aggregate_temp(self, state: State) -> float | None:
+        """Add the sensor's reading to the aggregate, return the aggregate temperature.
+
+        The reading is timestamped when last reported, an unchanged temperature is fresh.
+        """
         try:
             cur_temp = float(state.state)
             if not math.isfinite(cur_temp):
                 raise ValueError(f"Sensor has illegal state {state.state}")  # noqa: TRY301
-            self._attr_current_temperature = cur_temp
         except ValueError as ex:
             _LOGGER.error("Unable to update from sensor: %s", ex)
+            return None
+        return self._sensors.update(state.entity_id, cur_temp, state.last_reported_timestamp)
 
     async def _async_control_heating(
         self, time: datetime | None = None, force: bool = False
     ) -> None:
-        """Check if we need to turn heating on or off."""
-        async with self._temp_lock:
-            if not self._active and None not in (
+        """Check if we need to turn heating on or off.
+
+        Concurrent requests are coalesced: at most one evaluation runs at a time and at
+        most one re-run is pending, that evaluates the newest inputs on behalf of all the
+        requests that arrived in the meantime.
+        """
+        self.metrics.control_requests += 1
+        self._control_force |= force
+        if time is not None:
+            self._control_time = time
+        if self._control_running:
+            if self._control_rerun is None:
+                self._control_rerun = self.hass.loop.create_future()
+                self._control_waiting_since = perf_counter()
+            await asyncio.shield(self._control_rerun)
+            return
+        await self._async_run_control()
+
+    async def _async_run_control(self, done: asyncio.Future[None] | None = None) -> None:
+        """Run one evaluation of the coalesced requests, then start the pending re-run."""
+        self._control_running = True
+        time, force = self._control_time, self._control_force
+        self._control_time, self._control_force = None, False
+        # The wait is measured for the oldest request the evaluation serves
+        if (waiting_since := self._control_waiting_since) is not None:
+            self._control_waiting_since = None
+            self.metrics.control_wait.observe(perf_counter() - waiting_since)
+        else:
+            self.metrics.control_wait.observe(0)
+        try:
+            await self._async_evaluate_control(time, force)
+        except asyncio.CancelledError:
+            if done is not None:
+                done.cancel()
+            raise
+        except Exception as err:
+            if done is None:
+                raise
+            done.set_exception(err)
+        else:
+            if done is not None:
+                done.set_result(None)
+        finally:
+            self._control_running = False
+            if (rerun := self._control_rerun) is not None:
+                self._control_rerun = None
+                self._control_running = True
+                self.hass.async_create_task(
+                    self._async_run_control(rerun), eager_start=True
+                )
+
+    async def _async_evaluate_control(self, time: datetime | None, force: bool) -> None:
+        """Turn heating on or off based on the current inputs."""
+        self.metrics.control_evaluations += 1
+        start = perf_counter()
+        is_device_active = self._is_device_active
+        action = self._control_decision(time, force, is_device_active)
+        if self._load_manager is not None:
+            action = self._async_apply_load_limit(action, is_device_active)
+        self.metrics.decision_time.observe(perf_counter() - start)
+        self._trace_decision(action, is_device_active, force, time is not None)
+
+        if action == ACTION_TURN_ON:
+            _LOGGER.debug("Turning on heater %s", self.heater_entity_ids)
+            await self._async_heater_turn_on()
+        elif action in (ACTION_TURN_OFF, ACTION_EARLY_OFF, ACTION_FAILSAFE_OFF):
+            _LOGGER.debug("Turning off heater %s", self.heater_entity_ids)
+            await self._async_heater_turn_off()
+        elif action == ACTION_KEEP_ALIVE_ON:
+            self.metrics.keep_alive_commands += 1
+            _LOGGER.debug("Keep-alive - Turning on heater %s", self.heater_entity_ids)
+            await self._async_heater_turn_on(keep_alive=True)
+        elif action == ACTION_KEEP_ALIVE_OFF:
+            self.metrics.keep_alive_commands += 1
+            _LOGGER.debug("Keep-alive - Turning off heater %s", self.heater_entity_ids)
+            await self._async_heater_turn_off(keep_alive=True)
+
+    @callback
+    def _control_decision(
+        self, time: datetime | None, force: bool, is_device_active: bool | None
+    ) -> str:
+        """Return the action to take, one of the ACTION_* constants."""
+        if not self._active and None not in (
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+        ):
+            self._active = True
+            _LOGGER.debug(
+                (
+                    "Obtained current and target temperature. "
+                    "General thermostat active. %s, %s"
+                ),
                 self._attr_current_temperature,
                 self._attr_target_temperature,
+            )
+
+        if not self._active or self._attr_hvac_mode == HVACMode.OFF:
+            return ACTION_IDLE
+
+        # If the `force` argument is True, we
+        # ignore `min_cycle_duration`.
+        # If the `time` argument is not none, we were invoked for
+        # keep-alive purposes, and `min_cycle_duration` is irrelevant.
+        # If the cycle is not long enough, the decision is re-evaluated
+        # when it reaches `min_cycle_duration`, if the heater state is known.
+        if not force and time is None and self.min_cycle_duration:
+            if not self._is_min_cycle_long_enough():
+                self.metrics.min_cycle_blocked += 1
+                if self._heater_last_changed is not None:
+                    self._async_schedule_min_cycle_recheck()
+                return ACTION_MIN_CYCLE
+
+        if self._sensor_stale:
+            if self._stale_pwm is None:
+                if is_device_active:
+                    return ACTION_FAILSAFE_OFF
+                return ACTION_KEEP_ALIVE_OFF if time is not None else ACTION_IDLE
+            return self._pwm_decision(time, force, is_device_active)
+
+        if self._pwm is not None:
+            return self._pwm_decision(time, force, is_device_active)
+
+        assert self._attr_current_temperature is not None and self._attr_target_temperature is not None
+        assert self._min_threshold is not None and self._max_threshold is not None
+
+        min_temp = self._min_threshold
+        max_temp = self._max_threshold
+
+        if is_device_active:
+            if (self.ac_mode and self._attr_current_temperature <= min_temp) or (
+                not self.ac_mode and self._attr_current_temperature >= max_temp
             ):
-                self._active = True
-                _LOGGER.debug(
-                    (
-                        "Obtained current and target temperature. "
-                        "General thermostat active. %s, %s"
-                    ),
-                    self._attr_current_temperature,
-                    self._attr_target_temperature,
-                )
+                return ACTION_TURN_OFF
+            # Switch off early if the residual heat would overshoot the tolerance
+            overshoot = self._expected_overshoot()
+            if overshoot and (
+                (self.ac_mode and self._attr_current_temperature <= min_temp + overshoot)
+                or (not self.ac_mode and self._attr_current_temperature >= max_temp - overshoot)
+            ):
+                return ACTION_EARLY_OFF
+            if time is not None:
+                # The time argument is passed only in keep-alive case
+                return ACTION_KEEP_ALIVE_ON
+        else:
+            if (self.ac_mode and self._attr_current_temperature > max_temp) or (
+                not self.ac_mode and self._attr_current_temperature < min_temp
+            ):
+                return ACTION_TURN_ON
+            if time is not None:
+                # The time argument is passed only in keep-alive case
+                return ACTION_KEEP_ALIVE_OFF
+        return ACTION_IDLE
 
-            if not self._active or self._attr_hvac_mode == HVACMode.OFF:
-                return
+    @callback
+    def _pwm_decision(self, time: datetime | None, force: bool, is_device_active: bool | None) -> str:
+        """Return the action to take in PWM mode, the heater follows the state of the period.
 
-            # If the `force` argument is True, we
-            # ignore `min_cycle_duration`.
-            # If the `time` argument is not none, we were invoked for
-            # keep-alive purposes, and `min_cycle_duration` is irrelevant.
-            if not force and time is None and self.min_cycle_duration:
-                if self._is_device_active:
-                    current_state = STATE_ON
-                else:
-                    current_state = HVACMode.OFF
-                try:
-                    long_enough = condition.state(
-                        self.hass,
-                        self.heater_entity_id,
-                        current_state,
-                        self.min_cycle_duration,
-                    )
-                except ConditionError:
-                    long_enough = False
-
-                if not long_enough:
-                    return
+        A forced evaluation starts a new period, eg. on a new target temperature.
+        """
+        if force or self._remove_pwm_period is None:
+            self._async_start_pwm_period()
+        if is_device_active and not self._pwm_on:
+            return ACTION_TURN_OFF
+        if not is_device_active and self._pwm_on:
+            return ACTION_TURN_ON
+        if time is not None:
+            # The time argument is passed only in keep-alive case
+            return ACTION_KEEP_ALIVE_ON if self._pwm_on else ACTION_KEEP_ALIVE_OFF
+        return ACTION_IDLE
 
+    @callback
+    def _async_start_pwm_period(self) -> None:
+        """Start a PWM period now, arm the timers of its switch off and of the next period.
+
+        After a sensor timeout the period runs at the fixed fail-safe duty cycle.
+        """
+        pwm = self._stale_pwm if self._sensor_stale else self._pwm
+        assert pwm is not None
+        self._async_cancel_pwm_timers()
+        now = dt_util.utcnow()
+        on_time = timedelta(0)
+        if self._sensor_stale:
+            on_time = pwm.on_time_for_duty(self._sensor_timeout_duty_cycle)
+        elif self._attr_current_temperature is not None and self._attr_target_temperature is not None:
+            error = self._attr_target_temperature - self._attr_current_temperature
+            on_time = pwm.on_time(-error if self.ac_mode else error)
+        self._pwm_on = on_time > timedelta(0)
+        if self._pwm_on and on_time < pwm.period:
+            self._remove_pwm_off = async_track_point_in_utc_time(
+                self.hass, self._async_pwm_on_time_elapsed, now + on_time
+            )
+        self._remove_pwm_period = async_track_point_in_utc_time(
+            self.hass, self._async_pwm_period_elapsed, now + pwm.period
+        )
+
+    @callback
+    def _async_cancel_pwm_timers(self) -> None:
+        """Cancel the timers of the current PWM period."""
+        if self._remove_pwm_off is not None:
+            self._remove_pwm_off()
+            self._remove_pwm_off = None
+        if self._remove_pwm_period is not None:
+            self._remove_pwm_period()
+            self._remove_pwm_period = None
+
+    @callback
+    def _async_stop_pwm(self) -> None:
+        """Stop the PWM periods and reset the controller."""
+        self._async_cancel_pwm_timers()
+        self._pwm_on = False
+        if self._pwm is not None:
+            self._pwm.reset()
+
+    async def _async_pwm_on_time_elapsed(self, _: datetime) -> None:
+        """Turn the heater off at the end of the on time of the period."""
+        self._remove_pwm_off = None
+        self._pwm_on = False
+        await self._async_control_heating()
+        self.async_write_ha_state()
+
+    async def _async_pwm_period_elapsed(self, _: datetime) -> None:
+        """Start the next PWM period."""
+        self._remove_pwm_period = None
+        self._async_start_pwm_period()
+        await self._async_control_heating()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_apply_load_limit(self, action: str, is_device_active: bool | None) -> str:
+        """Request the capacity to turn on the heater, or release it if it stays off."""
+        assert self._load_manager is not None
+        if action == ACTION_TURN_ON:
             assert self._attr_current_temperature is not None and self._attr_target_temperature is not None
+            if not self._load_manager.async_request(
+                self.entity_id,
+                self._heater_power,
+                abs(self._attr_target_temperature - self._attr_current_temperature),
+                self._async_load_granted,
+            ):
+                self.metrics.load_shed += 1
+                return ACTION_LOAD_SHED
+        elif not is_device_active and self._actuator.pending is not True:
+            self._load_manager.async_release(self.entity_id)
+        return action
 
-            min_temp = self._attr_target_temperature - self._attr_cold_tolerance
-            max_temp = self._attr_target_temperature + self._attr_hot_tolerance
+    @callback
+    def _async_load_granted(self) -> None:
+        """Re-evaluate the control when the heater can be turned on."""
+        self.hass.async_create_task(self._async_control_heating(), eager_start=True)
 
-            if self._is_device_active:
-                if (self.ac_mode and self._attr_current_temperature <= min_temp) or (
-                    not self.ac_mode and self._attr_current_temperature >= max_temp
-                ):
-                    _LOGGER.debug("Turning off heater %s", self.heater_entity_id)
-                    await self._async_heater_turn_off()
-                elif time is not None:
-                    # The time argument is passed only in keep-alive case
-                    _LOGGER.debug(
-                        "Keep-alive - Turning on heater heater %s",
-                        self.heater_entity_id,
-                    )
-                    await self._async_heater_turn_on()
-            else:
-                if (self.ac_mode and self._attr_current_temperature > max_temp) or (
-                    not self.ac_mode and self._attr_current_temperature < min_temp
-                ):
-                    _LOGGER.debug("Turning on heater %s", self.heater_entity_id)
-                    await self._async_heater_turn_on()
-                elif time is not None:
-                    # The time argument is passed only in keep-alive case
-                    _LOGGER.debug(
-                        "Keep-alive - Turning off heater %s", self.heater_entity_id
-                    )
-                    await self._async_heater_turn_off()
+    @callback
+    def _trace_decision(
+        self, action: str, is_device_active: bool | None, force: bool, keep_alive: bool
+    ) -> None:
+        """Record a control decision with its inputs in the decision trace."""
+        self._trace.record(
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_cold_tolerance,
+            self._attr_hot_tolerance,
+            is_device_active,
+            force,
+            keep_alive,
+            action,
+        )
 
     @property
     def _is_device_active(self) -> bool | None:
-        """If the toggleable device is currently active."""
-        if not self.hass.states.get(self.heater_entity_id):
+        """If the toggleable devices are currently active under the heater policy."""
+        states = [
+            state
+            for entity_id in self.heater_entity_ids
+            if (state := self.hass.states.get(entity_id)) is not None
+        ]
+        if not states:
             return None
 
-        return self.hass.states.is_state(self.heater_entity_id, STATE_ON)
+        if self._heater_policy == HEATER_POLICY_ALL:
+            return len(states) == len(self.heater_entity_ids) and all(
+                state.state == STATE_ON for state in states
+            )
+        return any(state.state == STATE_ON for state in states)
 
-    async def _async_heater_turn_on(self) -> None:
+    async def _async_heater_turn_on(self, keep_alive: bool = False) -> None:
         """Turn heater toggleable device on."""
-        data = {ATTR_ENTITY_ID: self.heater_entity_id}
-        await self.hass.services.async_call(
-            HOMEASSISTANT_DOMAIN, SERVICE_TURN_ON, data, context=self._context
-        )
+        await self._actuator.async_turn_on(self._context, repeat=keep_alive)
 
-    async def _async_heater_turn_off(self) -> None:
+    async def _async_heater_turn_off(self, keep_alive: bool = False) -> None:
         """Turn heater toggleable device off."""
-        data = {ATTR_ENTITY_ID: self.heater_entity_id}
-        await self.hass.services.async_call(
-            HOMEASSISTANT_DOMAIN, SERVICE_TURN_OFF, data, context=self._context
-        )
+        await self._actuator.async_turn_off(self._context, repeat=keep_alive)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        if preset_mode not in (self.preset_modes or []):
+        if preset_mode not in self._preset_table:
             raise ValueError(
                 f"Got unsupported preset_mode {preset_mode}. Must be one of"
                 f" {self.preset_modes}"
@@ -719,14 +1646,98 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
             return
 
         self._attr_preset_mode = preset_mode
-        self._attr_target_temperature = self._attr_preset_temperatures[self._attr_preset_modes.index(self._attr_preset_mode)]
+        self._attr_target_temperature = self._preset_table.temperature(self._attr_preset_mode)
         if preset_mode == PRESET_NONE:
             self._set_attr_preset_mode_based_on_target_temp()
         elif preset_mode not in self._attr_auto_update_preset_modes:
             self._set_attr_preset_temperatures(PRESET_NONE, self._attr_target_temperature)
+        self._update_thresholds()
+        self._async_save_runtime_data()
         await self._async_control_heating(force=True)
         self.async_write_ha_state()
 
+    @final
+    async def async_handle_schedule_preset_mode_service(self, preset_mode: str, time: datetime) -> None:
+        """Validate and schedule a preset mode."""
+        self._valid_mode_or_raise("preset", preset_mode, self.preset_modes)
+        self.async_schedule_preset_mode(preset_mode, dt_util.as_utc(time))
+
+    @callback
+    def async_schedule_preset_mode(self, preset_mode: str, at: datetime) -> None:
+        """Schedule a preset mode to be reached at a time, replacing the scheduled one.
+
+        The weekly schedule keeps running, its transitions before the time still apply.
+        """
+        self._scheduled_preset = (preset_mode, at)
+        self._async_arm_scheduled_preset()
+
+    @callback
+    def _async_arm_scheduled_preset(self) -> None:
+        """Arm the timer of the earliest of the scheduled preset and the weekly transition."""
+        self._async_cancel_scheduled_preset()
+        starts = [
+            (self._preset_start(*scheduled), weekly)
+            for weekly, scheduled in ((False, self._scheduled_preset), (True, self._schedule_next))
+            if scheduled is not None
+        ]
+        if starts:
+            start, weekly = min(starts)
+            self._remove_scheduled_preset = async_track_point_in_utc_time(
+                self.hass, partial(self._async_scheduled_preset_due, weekly), start
+            )
+
+    @callback
+    def _preset_start(self, preset_mode: str, at: datetime) -> datetime:
+        """Return when to set a preset mode to be reached at a time.
+
+        With a thermal model the preset is set early enough to reach its temperature on
+        time (optimum start), at most max_preheat_time early.
+        """
+        start = at
+        if (self._thermal_model is not None
+            and self._attr_hvac_mode != HVACMode.OFF
+            and self._attr_current_temperature is not None
+            and (seconds := (at - dt_util.utcnow()).total_seconds()) > 0
+        ):
+            delay = self._thermal_model.start_delay(
+                self._model_temperature(self._attr_current_temperature),
+                self._model_temperature(self._preset_table.temperature(preset_mode)),
+                seconds,
+            )
+            start = max(at - timedelta(seconds=seconds - delay), at - self._max_preheat_time)
+        return start
+
+    @callback
+    def _async_cancel_scheduled_preset(self) -> None:
+        """Cancel the timer of the scheduled presets."""
+        if self._remove_scheduled_preset is not None:
+            self._remove_scheduled_preset()
+            self._remove_scheduled_preset = None
+
+    async def _async_scheduled_preset_due(self, weekly: bool, _: datetime) -> None:
+        """Set the due preset mode, a weekly transition arms the next one of the schedule.
+
+        The preset is set like by the user, so a preset selected by the user stays until
+        the next transition.
+        """
+        self._remove_scheduled_preset = None
+        if weekly:
+            assert self._schedule is not None and self._schedule_next is not None
+            preset_mode, at = self._schedule_next
+            self._schedule_applied = at
+            self._async_save_runtime_data()
+            at, next_preset_mode = self._schedule.next_transition(at)
+            self._schedule_next = (next_preset_mode, at)
+        else:
+            assert self._scheduled_preset is not None
+            preset_mode = self._scheduled_preset[0]
+            self._scheduled_preset = None
+        self._async_arm_scheduled_preset()
+        if preset_mode not in self._preset_table:
+            _LOGGER.warning("%s: scheduled preset %s is not configured", self.entity_id, preset_mode)
+            return
+        await self.async_set_preset_mode(preset_mode)
+
     @final
     async def async_handle_set_preset_temperature_service(self, preset_mode: str, temperature: float) -> None:
         """Validate and set new preset temperature."""
@@ -747,6 +1758,7 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
 
     async def async_set_preset_temperature(self, preset_mode: str, temperature: float) -> None:
         """Set new preset temperature."""
+        self._async_save_runtime_data()
         if (self._attr_preset_mode != PRESET_NONE
             and self._attr_preset_mode in self._attr_auto_update_preset_modes
         ):
@@ -775,10 +1787,13 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
 
     async def async_reset_preset_temperature(self, preset_mode: str | None) -> None:
         """Reset preset temperature."""
+        self._async_save_runtime_data()
         if preset_mode:
             await self.async_set_preset_temperature(preset_mode, self._presets[preset_mode])
         else:
-            self._attr_preset_temperatures = [self._attr_preset_temperatures[0], *self._presets.values()]
+            if self._preset_table.set_temperatures([self._attr_preset_temperatures[0], *self._presets.values()]):
+                self._attr_preset_temperatures = self._preset_table.temperatures
+                self._extra_state_attributes_cache = None
             if self._attr_preset_mode != PRESET_NONE:
                 await self.async_set_temperature(temperature=self._presets[self._attr_preset_mode])
             else:
@@ -799,5 +1814,151 @@ class GeneralThermostat(ClimateEntity, RestoreEntity, cached_properties=CACHED_P
         if (cold_tolerance is not None
             or hot_tolerance is not None
         ):
+            self._extra_state_attributes_cache = None
+            self._update_thresholds()
+            self._async_save_runtime_data()
             await self._async_control_heating(force=True)
             self.async_write_ha_state()
+
+    async def async_reconfigure(self, options: Mapping[str, Any]) -> bool:
+        """Apply changed config entry options to the live thermostat.
+
+        Return False if the options can't be applied without a reload, ie. the heater, the
+        sensor, the A/C mode, the control mode, the thermal model or the sensor timeout is
+        changed.
+        """
+        config = PLATFORM_SCHEMA_COMMON(dict(options))
+        if (self.hass is None
+            or config[CONF_HEATER] != self.heater_entity_ids
+            or config[CONF_HEATER_POLICY] != self._heater_policy
+            or config.get(CONF_HEAT_SOURCE) != self._heat_source_entity_id
+            or config[CONF_SENSOR] != self.sensor_entity_ids
+            or config.get(CONF_AC_MODE) != self.ac_mode
+            or (config[CONF_CONTROL_MODE] == CONTROL_MODE_PWM) != (self._pwm is not None)
+            or config[CONF_THERMAL_MODEL] != (self._thermal_model is not None)
+            or config.get(CONF_SENSOR_TIMEOUT) != self._sensor_timeout
+            or config[CONF_SENSOR_TIMEOUT_DUTY_CYCLE] / 100 != self._sensor_timeout_duty_cycle
+        ):
+            return False
+
+        if (cold_tolerance := config.get(CONF_COLD_TOLERANCE)) is not None:
+            self._attr_cold_tolerance = abs(cold_tolerance)
+        if (hot_tolerance := config.get(CONF_HOT_TOLERANCE)) is not None:
+            self._attr_hot_tolerance = abs(hot_tolerance)
+
+        for option, attr in ((CONF_MIN_TEMP, "_attr_min_temp"), (CONF_MAX_TEMP, "_attr_max_temp")):
+            if (value := config.get(option)) is not None:
+                setattr(self, attr, value)
+            elif hasattr(self, attr):
+                delattr(self, attr)
+
+        self._max_preheat_time = config[CONF_MAX_PREHEAT_TIME]
+        self.min_cycle_duration = config.get(CONF_MIN_DUR)
+        if not self.min_cycle_duration:
+            self._async_cancel_min_cycle_recheck()
+        for pwm in (self._pwm, self._stale_pwm):
+            if pwm is not None:
+                pwm.min_cycle = self.min_cycle_duration
+
+        if (keep_alive := config.get(CONF_KEEP_ALIVE)) != self._keep_alive:
+            self._async_unregister_keep_alive()
+            self._keep_alive = keep_alive
+            self._async_register_keep_alive()
+
+        presets = _get_presets(config)
+        auto_update_preset_modes = _get_auto_update_preset_modes(config, presets)
+        self._async_reconfigure_presets(presets, auto_update_preset_modes)
+
+        if (schedule := config.get(CONF_SCHEDULE) or None) != self._schedule:
+            self._schedule = schedule
+            self._schedule_applied = dt_util.utcnow()
+            self._async_start_schedule()
+
+        self._extra_state_attributes_cache = None
+        self._update_thresholds()
+        self._async_save_runtime_data()
+        await self._async_control_heating()
+        self.async_write_ha_state()
+        return True
+
+    @callback
+    def _async_reconfigure_presets(self, presets: dict[str, float], auto_update_preset_modes: list[str] | None) -> None:
+        """Apply changed presets, the changed preset temperatures of the remaining presets are kept."""
+        if presets == self._presets and auto_update_preset_modes == self._attr_auto_update_preset_modes:
+            return
+        self._attr_auto_update_preset_modes = auto_update_preset_modes if auto_update_preset_modes is not None else list(presets.keys())
+        if len(presets):
+            self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
+        else:
+            self._attr_supported_features &= ~ClimateEntityFeature.PRESET_MODE
+        self._preset_table = PresetTable(
+            [PRESET_NONE, *presets.keys()],
+            [
+                self._attr_preset_temperatures[0],
+                *(
+                    self._preset_table.temperature(mode) if mode in self._preset_table else temp
+                    for mode, temp in presets.items()
+                ),
+            ],
+            self._attr_auto_update_preset_modes,
+        )
+        self._attr_preset_modes = self._preset_table.modes
+        self._attr_preset_temperatures = self._preset_table.temperatures
+        self._presets = presets
+        if self._attr_preset_mode not in self._preset_table:
+            self._attr_preset_mode = PRESET_NONE
+        if self._attr_preset_mode == PRESET_NONE:
+            self._set_attr_preset_mode_based_on_target_temp()
+
+    @callback
+    def async_get_diagnostics(self) -> dict[str, Any]:
+        """Return the diagnostics of the thermostat."""
+        now = dt_util.utcnow().timestamp()
+        return {
+            "entity_id": self.entity_id,
+            "hvac_mode": self._attr_hvac_mode,
+            "hvac_action": self.hvac_action,
+            "current_temperature": self._attr_current_temperature,
+            "sensors": self._sensors.as_dict(),
+            "sensor_stale": self._sensor_stale,
+            "sensor_watchdog": None
+            if self._sensor_watchdog is None
+            else self._sensor_watchdog.as_dict(),
+            "target_temperature": self._attr_target_temperature,
+            "min_threshold": self._min_threshold,
+            "max_threshold": self._max_threshold,
+            "heaters": self.heater_entity_ids,
+            "heater_active": self._heater_active,
+            "pwm": None if self._pwm is None else {**self._pwm.as_dict(), "on": self._pwm_on},
+            "thermal_model": None
+            if self._thermal_model is None
+            else {
+                **self._thermal_model.as_dict(),
+                "trained": self._thermal_model.trained,
+                "overshoot": self._thermal_model.overshoot,
+            },
+            "schedule": None if self._schedule is None else self._schedule.as_list(),
+            "scheduled_preset": None
+            if self._scheduled_preset is None
+            else {"preset_mode": self._scheduled_preset[0], "time": self._scheduled_preset[1].isoformat()},
+            "schedule_next": None
+            if self._schedule_next is None
+            else {"preset_mode": self._schedule_next[0], "time": self._schedule_next[1].isoformat()},
+            "sensor_updates": self._sensor_updates,
+            "suppressed_state_writes": self._suppressed_state_writes,
+            "suppressed_actuator_commands": self._actuator.duplicates,
+            "actuator_command_retries": self._actuator.retries,
+            "heat_source": None if self._heat_source is None else self._heat_source.as_dict(),
+            "load_manager": None if self._load_manager is None else self._load_manager.as_dict(),
+            "metrics": self.metrics.as_dict(),
+            "runtime": {
+                window: dict(zip(("on_time", "cycles", "duty_cycle"), self.runtime_stats.window(window, now)))
+                for window in WINDOWS
+            },
+            "decision_trace": self._trace.as_list(),
+        }
+
+    @final
+    async def async_handle_dump_trace_service(self) -> ServiceResponse:
+        """Return the recorded control decisions."""
+        return {"decision_trace": self._trace.as_list()}
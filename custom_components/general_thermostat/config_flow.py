@@ -12,7 +12,9 @@ from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN, SensorDevic
 from homeassistant.const import CONF_NAME, DEGREE
 from homeassistant.helpers import selector
 from homeassistant.helpers.schema_config_entry_flow import (
+    SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
 )
 
@@ -26,10 +28,12 @@ from .const import (
     CONF_MIN_DUR,
     CONF_MIN_TEMP,
     CONF_PRESETS,
+    CONF_SCHEDULE,
     CONF_SENSOR,
     DEFAULT_TOLERANCE,
     DOMAIN,
 )
+from .schedule import weekly_schedule
 
 OPTIONS_SCHEMA = {
     vol.Required(CONF_AC_MODE): selector.BooleanSelector(
@@ -82,6 +86,10 @@ PRESETS_SCHEMA = {
         )
     )
     for v in CONF_PRESETS.values()
+} | {
+    vol.Optional(CONF_SCHEDULE): selector.TextSelector(
+        selector.TextSelectorConfig(multiline=True)
+    ),
 }
 
 CONFIG_SCHEMA = {
@@ -90,14 +98,30 @@ CONFIG_SCHEMA = {
 }
 
 
+async def _validate_presets(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the schedule."""
+    if schedule := user_input.get(CONF_SCHEDULE):
+        try:
+            weekly_schedule(schedule)
+        except vol.Invalid as err:
+            raise SchemaFlowError("invalid_schedule") from err
+    return user_input
+
+
 CONFIG_FLOW = {
     "user": SchemaFlowFormStep(vol.Schema(CONFIG_SCHEMA), next_step="presets"),
-    "presets": SchemaFlowFormStep(vol.Schema(PRESETS_SCHEMA)),
+    "presets": SchemaFlowFormStep(
+        vol.Schema(PRESETS_SCHEMA), validate_user_input=_validate_presets
+    ),
 }
 
 OPTIONS_FLOW = {
     "init": SchemaFlowFormStep(vol.Schema(OPTIONS_SCHEMA), next_step="presets"),
-    "presets": SchemaFlowFormStep(vol.Schema(PRESETS_SCHEMA)),
+    "presets": SchemaFlowFormStep(
+        vol.Schema(PRESETS_SCHEMA), validate_user_input=_validate_presets
+    ),
 }
 
 
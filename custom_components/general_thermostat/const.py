@@ -1,5 +1,7 @@
 """Constants for the General Thermostat helper."""
 
+from datetime import timedelta
+
 from homeassistant.components.climate import (
     PRESET_ACTIVITY,
     PRESET_AWAY,
@@ -11,24 +13,44 @@ from homeassistant.components.climate import (
 )
 from homeassistant.const import Platform
 
+ATTR_ACTUATOR_COMMAND_RETRIES = "actuator_command_retries"
 ATTR_AUTO_UPDATE_PRESET_MODES = "auto_update_preset_modes"
 ATTR_COLD_TOLERANCE = "cold_tolerance"
 ATTR_HOT_TOLERANCE = "hot_tolerance"
 ATTR_PRESET_TEMPERATURES = "preset_temperatures"
+ATTR_RUNTIME = "runtime"
+ATTR_SCHEDULE_APPLIED = "schedule_applied"
+ATTR_SENSOR_UPDATES = "sensor_updates"
+ATTR_SUPPRESSED_ACTUATOR_COMMANDS = "suppressed_actuator_commands"
+ATTR_SUPPRESSED_STATE_WRITES = "suppressed_state_writes"
+ATTR_THERMAL_MODEL = "thermal_model"
 
 DOMAIN = "general_thermostat"
 
-PLATFORMS = [Platform.CLIMATE]
+DATA_HEAT_SOURCE_CONFIGS = "heat_source_configs"
+DATA_HEAT_SOURCES = "heat_sources"
+DATA_KEEP_ALIVE_SCHEDULER = "keep_alive_scheduler"
+DATA_LOAD_MANAGER = "load_manager"
+DATA_SENSOR_WATCHDOG = "sensor_watchdog"
+DATA_STARTUP_COORDINATOR = "startup_coordinator"
+DATA_STORE = "store"
+
+PLATFORMS = [Platform.CLIMATE, Platform.SENSOR]
 
 PRESET_REDUCE = "reduce"
 
 CONF_AC_MODE = "ac_mode"
 CONF_AUTO_UPDATE_PRESET_MODES = "auto_update_preset_modes"
 CONF_COLD_TOLERANCE = "cold_tolerance"
+CONF_HEAT_SOURCES = "heat_sources"
 CONF_HEATER = "heater"
 CONF_HOT_TOLERANCE = "hot_tolerance"
+CONF_MAX_ACTIVE_HEATERS = "max_active_heaters"
+CONF_MAX_HEATER_POWER = "max_heater_power"
 CONF_MAX_TEMP = "max_temp"
 CONF_MIN_DUR = "min_cycle_duration"
+CONF_MIN_OFF_TIME = "min_off_time"
+CONF_MIN_ON_TIME = "min_on_time"
 CONF_MIN_TEMP = "min_temp"
 CONF_PRESETS = {
     p: f"{p}_temp"
@@ -43,9 +65,16 @@ CONF_PRESETS = {
         PRESET_REDUCE,
     )
 }
+CONF_SCHEDULE = "schedule"
 CONF_SENSOR = "target_sensor"
+CONF_STARTUP_CONCURRENCY = "startup_concurrency"
+CONF_STARTUP_DELAY = "startup_delay"
+DEFAULT_STARTUP_CONCURRENCY = 4
+DEFAULT_STARTUP_DELAY = timedelta(milliseconds=250)
 DEFAULT_TOLERANCE = 0.3
 
+SERVICE_DUMP_TRACE = "dump_trace"
 SERVICE_SET_PRESET_TEMPERATURE = "set_preset_temperature"
 SERVICE_RESET_PRESET_TEMPERATURE = "reset_preset_temperature"
+SERVICE_SCHEDULE_PRESET_MODE = "schedule_preset_mode"
 SERVICE_SET_TOLERANCE = "set_tolerance"
@@ -0,0 +1,19 @@
+"""Diagnostics support for General Thermostat."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    thermostat = getattr(entry, "runtime_data", None)
+    return {
+        "options": dict(entry.options),
+        "thermostat": None if thermostat is None else thermostat.async_get_diagnostics(),
+    }
@@ -0,0 +1,199 @@
+"""Heat sources shared by general thermostats."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.const import CONF_ENTITY_ID, STATE_OFF, STATE_ON
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
+from homeassistant.util import dt as dt_util
+
+from .actuator import ActuatorCommander
+from .const import (
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    DATA_HEAT_SOURCE_CONFIGS,
+    DATA_HEAT_SOURCES,
+    DOMAIN,
+)
+from .metrics import ControlMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HeatSource:
+    """A boiler or circulation pump driven by the demand of the thermostats it serves.
+
+    The thermostats report only the changes of their demand, the number of demanding
+    thermostats is kept, so each change is handled in constant time. The source is on
+    while any thermostat demands heat, respecting its own minimum on and off times. The
+    changes reported in the same loop iteration, eg. at startup, are handled together.
+    The source is closed when its last thermostat is removed, it is left in its state and
+    the source created for the next thermostat takes over.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        min_on_time: timedelta,
+        min_off_time: timedelta,
+    ) -> None:
+        """Initialize the heat source."""
+        self._hass = hass
+        self.entity_id = entity_id
+        self._min_on_time = min_on_time
+        self._min_off_time = min_off_time
+        self._demands: dict[str, bool] = {}
+        self.users: set[str] = set()
+        self._closed = False
+        self.demand = 0
+        self.metrics = ControlMetrics()
+        self._actuator = ActuatorCommander(hass, [entity_id], self.metrics)
+        self._active: bool | None = None
+        self._last_changed: datetime | None = None
+        self._remove_recheck: CALLBACK_TYPE | None = None
+        self._update_scheduled = False
+        self._remove_listener = async_track_state_change_event(
+            hass, [entity_id], self._async_source_changed
+        )
+        self._async_update_source_state()
+
+    @callback
+    def async_close(self) -> None:
+        """Stop following the source's state and cancel its timers."""
+        self._closed = True
+        self._remove_listener()
+        if self._remove_recheck is not None:
+            self._remove_recheck()
+            self._remove_recheck = None
+        self._actuator.async_cancel()
+
+    @callback
+    def async_set_demand(self, key: str, demand: bool) -> None:
+        """Set whether a thermostat demands heat."""
+        if (previous := self._demands.get(key)) == demand:
+            return
+        self._demands[key] = demand
+        if demand:
+            self.demand += 1
+        elif previous:
+            self.demand -= 1
+        self._async_schedule_update()
+
+    @callback
+    def async_remove_demand(self, key: str) -> None:
+        """Remove a thermostat."""
+        if self._demands.pop(key, False):
+            self.demand -= 1
+            self._async_schedule_update()
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Update the source in the next loop iteration."""
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self._hass.loop.call_soon(self._async_update)
+
+    @callback
+    def _async_source_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle the source's state changes."""
+        self._actuator.async_state_changed(event.data["new_state"])
+        self._async_update_source_state()
+        self._async_schedule_update()
+
+    @callback
+    def _async_update_source_state(self) -> None:
+        """Remember the source state and when it was last switched on or off."""
+        state = self._hass.states.get(self.entity_id)
+        if state is None or state.state not in (STATE_ON, STATE_OFF):
+            self._active = None
+            self._last_changed = None
+        else:
+            self._active = state.state == STATE_ON
+            self._last_changed = state.last_changed
+
+    @callback
+    def _async_update(self, _: datetime | None = None) -> None:
+        """Switch the source to follow the demand once its minimum on or off time passed."""
+        self._update_scheduled = False
+        if self._closed:
+            return
+        if self._remove_recheck is not None:
+            self._remove_recheck()
+            self._remove_recheck = None
+        on = self.demand > 0
+        if self._active is on and self._actuator.pending is None:
+            return
+        if self._active is not None and self._last_changed is not None:
+            min_time = self._min_on_time if self._active else self._min_off_time
+            if (recheck_at := self._last_changed + min_time) > dt_util.utcnow():
+                self._remove_recheck = async_track_point_in_utc_time(
+                    self._hass, self._async_update, recheck_at
+                )
+                return
+        _LOGGER.debug("Turning %s heat source %s", "on" if on else "off", self.entity_id)
+        self._hass.async_create_task(
+            self._actuator.async_turn_on(None) if on else self._actuator.async_turn_off(None),
+            eager_start=True,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the source for diagnostics."""
+        return {
+            "entity_id": self.entity_id,
+            "demand": self.demand,
+            "active": self._active,
+            "commanded": self._actuator.commanded,
+            "metrics": self.metrics.as_dict(),
+        }
+
+
+@callback
+def async_setup_heat_sources(hass: HomeAssistant, configs: list[dict[str, Any]]) -> None:
+    """Set up the configuration of the heat sources."""
+    hass.data.setdefault(DOMAIN, {})[DATA_HEAT_SOURCE_CONFIGS] = {
+        config[CONF_ENTITY_ID]: config for config in configs
+    }
+
+
+@callback
+def async_get_heat_source(hass: HomeAssistant, entity_id: str, key: str) -> HeatSource:
+    """Return the integration wide heat source of the entity, used by the thermostat."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    sources: dict[str, HeatSource] = data.setdefault(DATA_HEAT_SOURCES, {})
+    if (source := sources.get(entity_id)) is None:
+        config = data.get(DATA_HEAT_SOURCE_CONFIGS, {}).get(entity_id, {})
+        source = sources[entity_id] = HeatSource(
+            hass,
+            entity_id,
+            config.get(CONF_MIN_ON_TIME, timedelta(0)),
+            config.get(CONF_MIN_OFF_TIME, timedelta(0)),
+        )
+    source.users.add(key)
+    return source
+
+
+@callback
+def async_release_heat_source(hass: HomeAssistant, entity_id: str, key: str) -> None:
+    """Remove a thermostat from its heat source, close the source when it is unused."""
+    sources: dict[str, HeatSource] = hass.data.get(DOMAIN, {}).get(DATA_HEAT_SOURCES, {})
+    if (source := sources.get(entity_id)) is None:
+        return
+    source.async_remove_demand(key)
+    source.users.discard(key)
+    if not source.users:
+        source.async_close()
+        del sources[entity_id]
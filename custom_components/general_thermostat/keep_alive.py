@@ -0,0 +1,124 @@
+"""Integration wide keep-alive scheduler for general thermostats."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import math
+from typing import Any
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_KEEP_ALIVE_SCHEDULER, DOMAIN
+
+
+class _KeepAliveEntry:
+    """A registered keep-alive action."""
+
+    __slots__ = ("cancelled", "interval", "job", "phase")
+
+    def __init__(
+        self,
+        interval: float,
+        phase: float,
+        job: HassJob[[datetime], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Initialize the entry."""
+        self.cancelled = False
+        self.interval = interval
+        self.job = job
+        self.phase = phase
+
+    def next_due(self, timestamp: float) -> float:
+        """Return the first due time of the entry that is after the timestamp."""
+        due = self.phase + (math.floor((timestamp - self.phase) / self.interval) + 1) * self.interval
+        # The float division can round a due timestamp down to the previous interval
+        return due if due > timestamp else due + self.interval
+
+
+class KeepAliveScheduler:
+    """Fire the keep-alive actions of all thermostats from a single timer.
+
+    Each entry gets a deterministic phase offset within its interval based on its key,
+    so thermostats with the same interval are spread evenly instead of firing in bursts.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._heap: list[tuple[float, int, _KeepAliveEntry]] = []
+        self._sequence = itertools.count()
+        self._timer_at: float | None = None
+        self._remove_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self,
+        key: str,
+        interval: timedelta,
+        action: Callable[[datetime], Coroutine[Any, Any, None]],
+    ) -> CALLBACK_TYPE:
+        """Register a periodic keep-alive action, return a callback that unregisters it."""
+        interval_seconds = interval.total_seconds()
+        phase = zlib.crc32(key.encode()) % 1000 / 1000 * interval_seconds
+        entry = _KeepAliveEntry(interval_seconds, phase, HassJob(action))
+        self._push(entry, entry.next_due(dt_util.utcnow().timestamp()))
+        self._async_arm_timer()
+
+        @callback
+        def _async_unregister() -> None:
+            entry.cancelled = True
+
+        return _async_unregister
+
+    def _push(self, entry: _KeepAliveEntry, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._sequence), entry))
+
+    @callback
+    def _async_arm_timer(self) -> None:
+        """Arm the timer for the earliest due entry."""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        due = self._heap[0][0] if self._heap else None
+        if due == self._timer_at:
+            return
+        if self._remove_timer is not None:
+            self._remove_timer()
+            self._remove_timer = None
+        self._timer_at = due
+        if due is not None:
+            self._remove_timer = async_track_point_in_utc_time(
+                self._hass, self._async_fire, dt_util.utc_from_timestamp(due)
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Run the due actions and reschedule them."""
+        # The scheduled time is rounded to the microsecond, it can be before the due time
+        # it was armed for, which must be popped or the same time would be re-armed forever
+        timestamp = now.timestamp()
+        if self._timer_at is not None:
+            timestamp = max(timestamp, self._timer_at)
+        self._remove_timer = None
+        self._timer_at = None
+        while self._heap and self._heap[0][0] <= timestamp:
+            _, _, entry = heapq.heappop(self._heap)
+            if entry.cancelled:
+                continue
+            self._hass.async_run_hass_job(entry.job, now)
+            self._push(entry, entry.next_due(timestamp))
+        self._async_arm_timer()
+
+
+@callback
+def async_get_keep_alive_scheduler(hass: HomeAssistant) -> KeepAliveScheduler:
+    """Return the integration wide keep-alive scheduler."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := data.get(DATA_KEEP_ALIVE_SCHEDULER)) is None:
+        scheduler = data[DATA_KEEP_ALIVE_SCHEDULER] = KeepAliveScheduler(hass)
+    return scheduler
@@ -0,0 +1,166 @@
+"""Integration wide load limit of general thermostats."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import heapq
+import itertools
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_LOAD_MANAGER, DOMAIN
+from .metrics import WAIT_BUCKETS_MS, Histogram
+
+
+class _LoadRequest:
+    """A heater waiting to be turned on."""
+
+    __slots__ = ("cancelled", "grant", "key", "power", "since")
+
+    def __init__(self, key: str, power: float, since: float, grant: Callable[[], None]) -> None:
+        """Initialize the request."""
+        self.cancelled = False
+        self.grant = grant
+        self.key = key
+        self.power = power
+        self.since = since
+
+
+class LoadManager:
+    """Limit the number of simultaneously active heaters or their total power.
+
+    The heaters that can't be turned on wait in a priority queue ordered by how far their
+    zone is from its target, the ones with the same distance in arrival order. A heater
+    turned off has to queue again, so the zones take turns while the capacity is short.
+    Admission and release are O(log n), the superseded queue entries are skipped lazily
+    and dropped when they outnumber the waiting ones.
+    """
+
+    def __init__(self, max_active: int | None, max_power: float | None) -> None:
+        """Initialize the manager."""
+        self._max_active = max_active
+        self._max_power = max_power
+        self._active: dict[str, float] = {}
+        self._active_power = 0.0
+        self._heap: list[tuple[float, int, _LoadRequest]] = []
+        self._waiting: dict[str, _LoadRequest] = {}
+        self._sequence = itertools.count()
+        self.admitted = 0
+        self.queued = 0
+        self.wait_time = Histogram(WAIT_BUCKETS_MS)
+
+    def _fits(self, power: float) -> bool:
+        """Return True if a heater of the power can be turned on."""
+        if self._max_active is not None and len(self._active) >= self._max_active:
+            return False
+        return self._max_power is None or self._active_power + power <= self._max_power
+
+    @callback
+    def async_request(
+        self, key: str, power: float, deficit: float, grant: Callable[[], None]
+    ) -> bool:
+        """Request to turn on a heater.
+
+        Return True if the heater can be turned on now. Otherwise it is queued, or its
+        priority is updated if it is already queued, and grant is called when it can be.
+        The queue is admitted in priority order right away, so a request that fits and
+        comes first is granted without waiting for a release.
+        """
+        if key in self._active:
+            return True
+        if (request := self._waiting.get(key)) is None:
+            if not self._waiting and self._fits(power):
+                self._async_admit(key, power)
+                return True
+            self.queued += 1
+            request = _LoadRequest(key, power, monotonic(), grant)
+        else:
+            request.cancelled = True
+            request = _LoadRequest(key, power, request.since, grant)
+        self._waiting[key] = request
+        heapq.heappush(self._heap, (-deficit, next(self._sequence), request))
+        if len(self._heap) > 2 * len(self._waiting) + 16:
+            # Drop the superseded entries, so the heap is bounded by the waiting heaters
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+        self._async_grant_waiting(request)
+        return key in self._active
+
+    @callback
+    def async_set_active(self, key: str, power: float) -> None:
+        """Account for a heater that is on, even if it is over the limit."""
+        if key not in self._active:
+            self._async_withdraw(key)
+            self._async_admit(key, power)
+
+    @callback
+    def async_release(self, key: str) -> None:
+        """Release the capacity of a heater that is off, or withdraw its request."""
+        self._async_withdraw(key)
+        if (power := self._active.pop(key, None)) is not None:
+            self._active_power -= power
+        self._async_grant_waiting()
+
+    @callback
+    def _async_admit(self, key: str, power: float) -> None:
+        self._active[key] = power
+        self._active_power += power
+        self.admitted += 1
+
+    @callback
+    def _async_withdraw(self, key: str) -> None:
+        if (request := self._waiting.pop(key, None)) is not None:
+            request.cancelled = True
+
+    @callback
+    def _async_grant_waiting(self, requesting: _LoadRequest | None = None) -> None:
+        """Admit the waiting heaters in priority order while they fit.
+
+        The requesting heater is not called back, its request returns the grant.
+        """
+        while self._heap:
+            request = self._heap[0][2]
+            if request.cancelled:
+                heapq.heappop(self._heap)
+                continue
+            if not self._fits(request.power):
+                return
+            heapq.heappop(self._heap)
+            del self._waiting[request.key]
+            self.wait_time.observe(monotonic() - request.since)
+            self._async_admit(request.key, request.power)
+            if request is not requesting:
+                request.grant()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state and the metrics of the manager."""
+        return {
+            "max_active_heaters": self._max_active,
+            "max_heater_power": self._max_power,
+            "active_heaters": len(self._active),
+            "active_power": self._active_power,
+            "queue_depth": len(self._waiting),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "wait_time": self.wait_time.as_dict(),
+        }
+
+
+@callback
+def async_setup_load_manager(
+    hass: HomeAssistant, max_active: int | None, max_power: float | None
+) -> None:
+    """Set up the integration wide load manager, if there is a limit."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if max_active is None and max_power is None:
+        data.pop(DATA_LOAD_MANAGER, None)
+    else:
+        data[DATA_LOAD_MANAGER] = LoadManager(max_active, max_power)
+
+
+@callback
+def async_get_load_manager(hass: HomeAssistant) -> LoadManager | None:
+    """Return the integration wide load manager, None if there is no limit."""
+    return hass.data.get(DOMAIN, {}).get(DATA_LOAD_MANAGER)
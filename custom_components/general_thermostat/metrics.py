@@ -0,0 +1,104 @@
+"""Control loop instrumentation of general thermostats."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of the histogram buckets in milliseconds, the last bucket is unbounded
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0, 5000.0, 10000.0)
+WAIT_BUCKETS_MS = (1e3, 5e3, 1e4, 3e4, 6e4, 3e5, 6e5, 1.8e6, 3.6e6)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets."""
+
+    __slots__ = ("bounds", "count", "counts", "max", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        self.count = 0
+        self.counts = [0] * (len(bounds) + 1)
+        self.max = 0.0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add a duration to the histogram."""
+        ms = seconds * 1000
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.sum += ms
+        if ms > self.max:
+            self.max = ms
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration in milliseconds."""
+        return self.sum / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict, the buckets are keyed by their upper bound."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "max_ms": self.max,
+            "buckets_ms": {
+                **{f"le_{bound:g}": count for bound, count in zip(self.bounds, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class ControlMetrics:
+    """Monotonic counters and latency histograms of a thermostat's control loop.
+
+    Each event is recorded in constant time, nothing is computed until the metrics are read.
+    """
+
+    __slots__ = (
+        "command_round_trip",
+        "control_evaluations",
+        "control_requests",
+        "control_wait",
+        "decision_time",
+        "keep_alive_commands",
+        "load_shed",
+        "min_cycle_blocked",
+        "turn_off_calls",
+        "turn_on_calls",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.control_requests = 0
+        self.control_evaluations = 0
+        self.min_cycle_blocked = 0
+        self.turn_on_calls = 0
+        self.turn_off_calls = 0
+        self.keep_alive_commands = 0
+        self.load_shed = 0
+        self.control_wait = Histogram()
+        self.decision_time = Histogram()
+        self.command_round_trip = Histogram()
+
+    @property
+    def coalesced_control_requests(self) -> int:
+        """Return the number of control requests served by another request's evaluation."""
+        return self.control_requests - self.control_evaluations
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        return {
+            "control_requests": self.control_requests,
+            "control_evaluations": self.control_evaluations,
+            "coalesced_control_requests": self.coalesced_control_requests,
+            "min_cycle_blocked": self.min_cycle_blocked,
+            "turn_on_calls": self.turn_on_calls,
+            "turn_off_calls": self.turn_off_calls,
+            "keep_alive_commands": self.keep_alive_commands,
+            "load_shed": self.load_shed,
+            "control_wait": self.control_wait.as_dict(),
+            "decision_time": self.decision_time.as_dict(),
+            "command_round_trip": self.command_round_trip.as_dict(),
+        }
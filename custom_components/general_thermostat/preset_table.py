@@ -0,0 +1,107 @@
+"""Preset table for general thermostats."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from homeassistant.components.climate import PRESET_NONE
+
+
+class PresetTable:
+    """Preset modes and their temperatures with indexed lookups.
+
+    The modes and temperatures lists are never mutated, a new temperatures list is created
+    on each change, so they can be used directly as state attributes.
+
+    The inverse index maps the temperatures of the presets that are not auto updated to
+    the preset indexes, the preset with the highest index wins if they share a temperature.
+    """
+
+    __slots__ = ("_auto_update_modes", "_index", "_inverse", "_modes", "_temperatures")
+
+    def __init__(
+        self,
+        modes: list[str],
+        temperatures: list[float | None],
+        auto_update_modes: Iterable[str],
+    ) -> None:
+        """Initialize the table."""
+        self._modes = modes
+        self._index = {mode: index for index, mode in enumerate(modes)}
+        self._auto_update_modes = frozenset(auto_update_modes)
+        self._temperatures = temperatures
+        self._inverse: dict[float, list[int]] = {}
+        self._build_inverse()
+
+    def __contains__(self, mode: object) -> bool:
+        """Return True if the preset mode is in the table."""
+        return mode in self._index
+
+    @property
+    def modes(self) -> list[str]:
+        """Return the preset modes."""
+        return self._modes
+
+    @property
+    def temperatures(self) -> list[float | None]:
+        """Return the preset temperatures in the order of the preset modes."""
+        return self._temperatures
+
+    def index(self, mode: str) -> int:
+        """Return the index of the preset mode."""
+        return self._index[mode]
+
+    def temperature(self, mode: str) -> float | None:
+        """Return the temperature of the preset mode."""
+        return self._temperatures[self._index[mode]]
+
+    def set_temperature(self, mode: str, temperature: float | None) -> bool:
+        """Set the temperature of the preset mode, return True if it is changed."""
+        index = self._index[mode]
+        old_temperature = self._temperatures[index]
+        if old_temperature == temperature:
+            return False
+        temperatures = self._temperatures.copy()
+        temperatures[index] = temperature
+        self._temperatures = temperatures
+        if self._is_indexed(mode):
+            self._remove_inverse(old_temperature, index)
+            self._add_inverse(temperature, index)
+        return True
+
+    def set_temperatures(self, temperatures: list[float | None]) -> bool:
+        """Set the temperatures of all preset modes, return True if they are changed."""
+        if temperatures == self._temperatures:
+            return False
+        self._temperatures = temperatures.copy()
+        self._build_inverse()
+        return True
+
+    def preset_for_temperature(self, temperature: float | None) -> str:
+        """Return the not auto updated preset mode with the temperature, or PRESET_NONE."""
+        if (indexes := self._inverse.get(temperature)) is None:  # type: ignore[arg-type]
+            return PRESET_NONE
+        return self._modes[indexes[-1]]
+
+    def _is_indexed(self, mode: str) -> bool:
+        return mode != PRESET_NONE and mode not in self._auto_update_modes
+
+    def _build_inverse(self) -> None:
+        self._inverse = {}
+        for index, mode in enumerate(self._modes):
+            if self._is_indexed(mode):
+                self._add_inverse(self._temperatures[index], index)
+
+    def _add_inverse(self, temperature: float | None, index: int) -> None:
+        if temperature is None:
+            return
+        indexes = self._inverse.setdefault(temperature, [])
+        indexes.append(index)
+        indexes.sort()
+
+    def _remove_inverse(self, temperature: float | None, index: int) -> None:
+        if temperature is None or (indexes := self._inverse.get(temperature)) is None:
+            return
+        indexes.remove(index)
+        if not indexes:
+            del self._inverse[temperature]
@@ -0,0 +1,66 @@
+"""Time proportional control of general thermostats."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+
+class PwmController:
+    """Duty cycle of a time proportional (PWM) period from a PI control law.
+
+    The duty cycle is kp * error + the integral term, the integral accumulates
+    ki * error * period (in hours) and is clamped to [0, 1] to not wind up. The on time is
+    rounded to nothing or to the whole period if the on or the off part would be shorter
+    than min_cycle_duration.
+    """
+
+    __slots__ = ("duty", "integral", "ki", "kp", "min_cycle", "period")
+
+    def __init__(
+        self,
+        period: timedelta,
+        kp: float,
+        ki: float,
+        min_cycle: timedelta | None,
+    ) -> None:
+        """Initialize the controller."""
+        self.period = period
+        self.kp = kp
+        self.ki = ki
+        self.min_cycle = min_cycle
+        self.integral = 0.0
+        self.duty = 0.0
+
+    def on_time(self, error: float) -> timedelta:
+        """Return the on time of the next period for the error, update the integral term."""
+        self.integral = min(
+            max(self.integral + self.ki * error * self.period.total_seconds() / 3600, 0.0), 1.0
+        )
+        return self.on_time_for_duty(self.kp * error + self.integral)
+
+    def on_time_for_duty(self, duty: float) -> timedelta:
+        """Return the on time of the next period for a fixed duty cycle."""
+        self.duty = min(max(duty, 0.0), 1.0)
+        on_time = self.period * self.duty
+        if self.min_cycle:
+            if on_time < self.min_cycle:
+                on_time = timedelta(0)
+            elif self.period - on_time < self.min_cycle:
+                on_time = self.period
+        return on_time
+
+    def reset(self) -> None:
+        """Reset the integral term."""
+        self.integral = 0.0
+        self.duty = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the controller."""
+        return {
+            "period": self.period.total_seconds(),
+            "kp": self.kp,
+            "ki": self.ki,
+            "integral": self.integral,
+            "duty": self.duty,
+        }
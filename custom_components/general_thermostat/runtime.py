@@ -0,0 +1,152 @@
+"""Heater runtime accounting of general thermostats."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# The rolling windows, their length in seconds and number of buckets
+WINDOW_1H = "1h"
+WINDOW_24H = "24h"
+WINDOW_7D = "7d"
+WINDOWS = {
+    WINDOW_1H: (3600, 60),
+    WINDOW_24H: (86400, 96),
+    WINDOW_7D: (604800, 168),
+}
+
+
+class _RollingWindow:
+    """The cumulative on time and cycles at the bucket boundaries of the last window.
+
+    The value of the window is the cumulative value now minus the one at the oldest
+    boundary, so it is exact to the length of a bucket.
+    """
+
+    __slots__ = ("_bucket", "_cycles", "_on_time", "bucket_seconds", "size")
+
+    def __init__(self, seconds: int, size: int) -> None:
+        """Initialize an empty window."""
+        self.size = size
+        self.bucket_seconds = seconds / size
+        self._bucket: int | None = None
+        self._on_time = [0.0] * size
+        self._cycles = [0] * size
+
+    def advance(self, stats: RuntimeStats, timestamp: float) -> None:
+        """Record the cumulative values at the boundaries passed since the last call.
+
+        The heater state didn't change since the last call, so the values at the
+        boundaries are computed from the current state.
+        """
+        bucket = int(timestamp // self.bucket_seconds)
+        first = bucket - self.size + 1
+        if self._bucket is not None:
+            if bucket <= self._bucket:
+                return
+            first = max(first, self._bucket + 1)
+        for boundary in range(first, bucket + 1):
+            index = boundary % self.size
+            self._on_time[index] = stats.cumulative_on_time(boundary * self.bucket_seconds)
+            self._cycles[index] = stats.cycles
+        self._bucket = bucket
+
+    def start(self) -> float:
+        """Return the time of the oldest boundary of the window."""
+        assert self._bucket is not None
+        return (self._bucket - self.size + 1) * self.bucket_seconds
+
+    def values(self, stats: RuntimeStats, timestamp: float) -> tuple[float, int, float | None]:
+        """Return the on time, the cycles and the duty cycle in percent in the window."""
+        self.advance(stats, timestamp)
+        assert self._bucket is not None
+        oldest = (self._bucket + 1) % self.size
+        on_time = stats.cumulative_on_time(timestamp) - self._on_time[oldest]
+        cycles = stats.cycles - self._cycles[oldest]
+        elapsed = timestamp - max(self.start(), stats.since)
+        return on_time, cycles, on_time / elapsed * 100 if elapsed > 0 else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the recorded boundaries."""
+        return {"bucket": self._bucket, "on_time": self._on_time, "cycles": self._cycles}
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore the recorded boundaries."""
+        if len(data["on_time"]) != self.size or len(data["cycles"]) != self.size:
+            return
+        self._bucket = None if data["bucket"] is None else int(data["bucket"])
+        self._on_time = [float(value) for value in data["on_time"]]
+        self._cycles = [int(value) for value in data["cycles"]]
+
+
+class RuntimeStats:
+    """Runtime, cycle count and duty cycle of a heater, in total and in rolling windows.
+
+    A heater transition updates the totals in O(1), the windows record the cumulative
+    totals at their bucket boundaries, each boundary once, so the memory is bounded by the
+    number of buckets whatever the number of transitions.
+    """
+
+    __slots__ = ("_on_since", "_windows", "cycles", "on_time", "since")
+
+    def __init__(self, timestamp: float) -> None:
+        """Initialize the stats."""
+        self.since = timestamp
+        self.on_time = 0.0
+        self.cycles = 0
+        self._on_since: float | None = None
+        self._windows = {key: _RollingWindow(*window) for key, window in WINDOWS.items()}
+
+    def cumulative_on_time(self, timestamp: float) -> float:
+        """Return the total on time at the time, including the current run."""
+        if self._on_since is None:
+            return self.on_time
+        return self.on_time + max(timestamp - self._on_since, 0.0)
+
+    def switched(self, active: bool, timestamp: float, transition: bool = True) -> None:
+        """Account for the heater turned on or off at the time.
+
+        A transition turning the heater on counts as a cycle, the initial state doesn't.
+        """
+        for window in self._windows.values():
+            window.advance(self, timestamp)
+        if active:
+            if self._on_since is None:
+                self._on_since = timestamp
+                if transition:
+                    self.cycles += 1
+        elif self._on_since is not None:
+            self.on_time = self.cumulative_on_time(timestamp)
+            self._on_since = None
+
+    def window(self, key: str, timestamp: float) -> tuple[float, int, float | None]:
+        """Return the on time, the cycles and the duty cycle in percent in a window."""
+        return self._windows[key].values(self, timestamp)
+
+    def as_dict(self, timestamp: float) -> dict[str, Any]:
+        """Return the stats to store, the current run is accounted up to the time."""
+        for window in self._windows.values():
+            window.advance(self, timestamp)
+        return {
+            "since": self.since,
+            "on_time": self.cumulative_on_time(timestamp),
+            "cycles": self.cycles,
+            "windows": {key: window.as_dict() for key, window in self._windows.items()},
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore the stored stats, the heater is off until its state is known."""
+        try:
+            since = float(data["since"])
+            on_time = float(data["on_time"])
+            cycles = int(data["cycles"])
+            windows = data["windows"]
+            for key, window in self._windows.items():
+                if (window_data := windows.get(key)) is not None:
+                    window.load(window_data)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self._windows = {key: _RollingWindow(*window) for key, window in WINDOWS.items()}
+            return
+        self.since = since
+        self.on_time = on_time
+        self.cycles = cycles
+        self._on_since = None
@@ -0,0 +1,127 @@
+"""Weekly preset schedule of general thermostats."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.climate import PRESET_NONE
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_PRESETS
+
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+MINUTES_PER_DAY = 24 * 60
+
+
+class WeeklySchedule:
+    """Preset transitions of a week, as sorted minutes of the week and their presets.
+
+    The next and the last transition are found by bisection, in O(log n) time.
+    """
+
+    __slots__ = ("minutes", "presets")
+
+    def __init__(self, transitions: dict[int, str]) -> None:
+        """Initialize the schedule from the presets keyed by the minute of the week."""
+        self.minutes = sorted(transitions)
+        self.presets = [transitions[minute] for minute in self.minutes]
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the schedules have the same transitions."""
+        return (
+            isinstance(other, WeeklySchedule)
+            and self.minutes == other.minutes
+            and self.presets == other.presets
+        )
+
+    def __bool__(self) -> bool:
+        """Return True if the schedule has transitions."""
+        return bool(self.minutes)
+
+    def next_transition(self, after: datetime) -> tuple[datetime, str]:
+        """Return the time and the preset of the first transition after the time."""
+        week_start, minute = _week_position(after)
+        index = bisect_right(self.minutes, minute)
+        if index == len(self.minutes):
+            index = 0
+            week_start += timedelta(days=7)
+        return _local_time(week_start, self.minutes[index]), self.presets[index]
+
+    def last_transition(self, at: datetime) -> tuple[datetime, str]:
+        """Return the time and the preset of the last transition at or before the time."""
+        week_start, minute = _week_position(at)
+        index = bisect_right(self.minutes, minute) - 1
+        if index < 0:
+            index = len(self.minutes) - 1
+            week_start -= timedelta(days=7)
+        return _local_time(week_start, self.minutes[index]), self.presets[index]
+
+    def as_list(self) -> list[str]:
+        """Return the transitions in the configuration format."""
+        return [
+            f"{DAYS[minute // MINUTES_PER_DAY]} "
+            f"{minute % MINUTES_PER_DAY // 60:02d}:{minute % 60:02d} {preset}"
+            for minute, preset in zip(self.minutes, self.presets)
+        ]
+
+
+def _week_position(time: datetime) -> tuple[datetime, int]:
+    """Return the local naive start of the week of the time, and the minute of the week."""
+    local = dt_util.as_local(time)
+    minute = local.weekday() * MINUTES_PER_DAY + local.hour * 60 + local.minute
+    week_start = datetime(local.year, local.month, local.day) - timedelta(days=local.weekday())
+    return week_start, minute
+
+
+def _local_time(week_start: datetime, minute: int) -> datetime:
+    """Return the UTC time of the wall clock minute of the week."""
+    return dt_util.as_utc(
+        (week_start + timedelta(minutes=minute)).replace(tzinfo=dt_util.get_default_time_zone())
+    )
+
+
+def _parse_days(days: str) -> list[int]:
+    """Parse eg. daily, mon-fri or sat,sun to weekday numbers."""
+    if days == "daily":
+        return list(range(7))
+    weekdays: list[int] = []
+    for part in days.split(","):
+        first, _, last = part.partition("-")
+        if first not in DAYS or (last and last not in DAYS):
+            raise vol.Invalid(f"Invalid days: {days}")
+        start = DAYS.index(first)
+        end = DAYS.index(last) if last else start
+        weekdays.extend(day % 7 for day in range(start, end + 1 if end >= start else end + 8))
+    return weekdays
+
+
+def weekly_schedule(value: Any) -> WeeklySchedule:
+    """Validate a schedule, a list or lines of "<days> <HH:MM> <preset>" transitions."""
+    if isinstance(value, WeeklySchedule):
+        return value
+    if isinstance(value, str):
+        value = value.splitlines()
+    if not isinstance(value, list):
+        raise vol.Invalid("Schedule must be a list of transitions")
+    transitions: dict[int, str] = {}
+    for entry in value:
+        if not isinstance(entry, str):
+            raise vol.Invalid(f"Invalid transition: {entry}")
+        if not (entry := entry.strip()):
+            continue
+        try:
+            days, time, preset = entry.lower().split()
+            hour, minute = (int(part) for part in time.split(":"))
+        except ValueError as err:
+            raise vol.Invalid(f"Invalid transition: {entry}") from err
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise vol.Invalid(f"Invalid time: {time}")
+        if preset != PRESET_NONE and preset not in CONF_PRESETS:
+            raise vol.Invalid(f"Invalid preset: {preset}")
+        for day in _parse_days(days):
+            transitions[day * MINUTES_PER_DAY + hour * 60 + minute] = preset
+    return WeeklySchedule(transitions)
@@ -0,0 +1,189 @@
+"""Heater runtime and diagnostic sensors of general thermostats."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from time import time
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+from .climate import GeneralThermostat
+from .runtime import WINDOW_1H, WINDOW_24H, WINDOW_7D
+
+# The sensors only read in-memory counters, they are polled instead of written on each event
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GeneralThermostatSensorEntityDescription(SensorEntityDescription):
+    """Describes a general thermostat sensor."""
+
+    value_fn: Callable[[GeneralThermostat], float | int | None]
+
+
+def _runtime_sensor_types(window: str, period: str) -> tuple[GeneralThermostatSensorEntityDescription, ...]:
+    """Return the descriptions of the heater runtime sensors of a rolling window."""
+    return (
+        GeneralThermostatSensorEntityDescription(
+            key=f"heater_runtime_{window}",
+            name=f"Heater runtime {period}",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            suggested_unit_of_measurement=UnitOfTime.MINUTES,
+            suggested_display_precision=0,
+            value_fn=lambda thermostat: thermostat.runtime_stats.window(window, time())[0],
+        ),
+        GeneralThermostatSensorEntityDescription(
+            key=f"heater_cycles_{window}",
+            name=f"Heater cycles {period}",
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=lambda thermostat: thermostat.runtime_stats.window(window, time())[1],
+        ),
+        GeneralThermostatSensorEntityDescription(
+            key=f"heater_duty_cycle_{window}",
+            name=f"Heater duty cycle {period}",
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=PERCENTAGE,
+            suggested_display_precision=1,
+            value_fn=lambda thermostat: thermostat.runtime_stats.window(window, time())[2],
+        ),
+    )
+
+
+SENSOR_TYPES: tuple[GeneralThermostatSensorEntityDescription, ...] = (
+    GeneralThermostatSensorEntityDescription(
+        key="heater_runtime",
+        name="Heater runtime",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=1,
+        value_fn=lambda thermostat: thermostat.runtime_stats.cumulative_on_time(time()),
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="heater_cycles",
+        name="Heater cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda thermostat: thermostat.runtime_stats.cycles,
+    ),
+    *_runtime_sensor_types(WINDOW_1H, "last hour"),
+    *_runtime_sensor_types(WINDOW_24H, "last 24 hours"),
+    *_runtime_sensor_types(WINDOW_7D, "last 7 days"),
+)
+
+DIAGNOSTIC_SENSOR_TYPES: tuple[GeneralThermostatSensorEntityDescription, ...] = (
+    GeneralThermostatSensorEntityDescription(
+        key="control_evaluations",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Control evaluations",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda thermostat: thermostat.metrics.control_evaluations,
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="coalesced_control_requests",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Coalesced control requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda thermostat: thermostat.metrics.coalesced_control_requests,
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="min_cycle_blocked",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Min cycle duration blocked decisions",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda thermostat: thermostat.metrics.min_cycle_blocked,
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="actuator_calls",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Actuator calls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda thermostat: thermostat.metrics.turn_on_calls + thermostat.metrics.turn_off_calls,
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="control_wait",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Mean control wait",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda thermostat: thermostat.metrics.control_wait.mean,
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="decision_time",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Mean decision time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=3,
+        value_fn=lambda thermostat: thermostat.metrics.decision_time.mean,
+    ),
+    GeneralThermostatSensorEntityDescription(
+        key="command_round_trip",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Mean actuator round trip time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        value_fn=lambda thermostat: thermostat.metrics.command_round_trip.mean,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Initialize config entry."""
+    thermostat: GeneralThermostat = config_entry.runtime_data
+    async_add_entities(
+        GeneralThermostatSensor(thermostat, description)
+        for description in (*SENSOR_TYPES, *DIAGNOSTIC_SENSOR_TYPES)
+    )
+
+
+class GeneralThermostatSensor(SensorEntity):
+    """Heater runtime or control loop sensor of a general thermostat."""
+
+    entity_description: GeneralThermostatSensorEntityDescription
+
+    def __init__(
+        self,
+        thermostat: GeneralThermostat,
+        description: GeneralThermostatSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._thermostat = thermostat
+        self._attr_name = f"{thermostat.name} {description.name}"
+        self._attr_unique_id = f"{thermostat.unique_id}_{description.key}"
+        self._attr_device_info = thermostat.device_info
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self._thermostat)
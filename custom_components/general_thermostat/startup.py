@@ -0,0 +1,131 @@
+"""Startup coordinator for general thermostats."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+
+from .const import (
+    DATA_STARTUP_COORDINATOR,
+    DEFAULT_STARTUP_CONCURRENCY,
+    DEFAULT_STARTUP_DELAY,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STARTUP_CHECK_TIMEOUT = 30
+
+StartupCheck = Callable[[], Coroutine[Any, Any, None]]
+StartupCallback = Callable[[], StartupCheck | None]
+
+
+class _StartupEntry:
+    """A thermostat waiting for startup."""
+
+    __slots__ = ("cancelled", "startup")
+
+    def __init__(self, startup: StartupCallback) -> None:
+        """Initialize the entry."""
+        self.cancelled = False
+        self.startup = startup
+
+
+class StartupCoordinator:
+    """Start the thermostats in batches and release their actuator checks in a rate limited queue.
+
+    The startup callbacks of the thermostats added together read the states in a single pass,
+    the initial actuator checks they return are run by at most `concurrency` workers, each
+    waiting `delay` between its checks.
+    """
+
+    def __init__(self, hass: HomeAssistant, concurrency: int, delay: timedelta) -> None:
+        """Initialize the coordinator."""
+        self._hass = hass
+        self._concurrency = concurrency
+        self._delay = delay.total_seconds()
+        self._pending: list[_StartupEntry] = []
+        self._scheduled = False
+        self._queue: deque[tuple[_StartupEntry, StartupCheck]] = deque()
+        self._workers = 0
+
+    @callback
+    def async_add(self, startup: StartupCallback) -> CALLBACK_TYPE:
+        """Add a thermostat to start, return a callback that removes it."""
+        entry = _StartupEntry(startup)
+        self._pending.append(entry)
+        if not self._scheduled:
+            self._scheduled = True
+            if self._hass.state is CoreState.running:
+                # Thermostats added in the same loop iteration are started together
+                self._hass.loop.call_soon(self._async_start)
+            else:
+                self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, self._async_start)
+
+        @callback
+        def _async_remove() -> None:
+            entry.cancelled = True
+
+        return _async_remove
+
+    @callback
+    def _async_start(self, _: Event | None = None) -> None:
+        """Run the startup callbacks and queue the returned checks."""
+        pending = self._pending
+        self._pending = []
+        self._scheduled = False
+        for entry in pending:
+            if not entry.cancelled and (check := entry.startup()) is not None:
+                self._queue.append((entry, check))
+        while self._workers < min(self._concurrency, len(self._queue)):
+            self._workers += 1
+            self._hass.async_create_background_task(
+                self._async_worker(), f"{DOMAIN} startup"
+            )
+
+    async def _async_worker(self) -> None:
+        """Run the queued checks."""
+        try:
+            while self._queue:
+                entry, check = self._queue.popleft()
+                if entry.cancelled:
+                    continue
+                try:
+                    async with asyncio.timeout(STARTUP_CHECK_TIMEOUT):
+                        await check()
+                except TimeoutError:
+                    _LOGGER.warning("Startup check timed out")
+                except Exception:
+                    _LOGGER.exception("Startup check failed")
+                if self._queue and self._delay:
+                    await asyncio.sleep(self._delay)
+        finally:
+            self._workers -= 1
+
+
+@callback
+def async_setup_startup_coordinator(
+    hass: HomeAssistant, concurrency: int, delay: timedelta
+) -> None:
+    """Set up the integration wide startup coordinator."""
+    hass.data.setdefault(DOMAIN, {})[DATA_STARTUP_COORDINATOR] = StartupCoordinator(
+        hass, concurrency, delay
+    )
+
+
+@callback
+def async_get_startup_coordinator(hass: HomeAssistant) -> StartupCoordinator:
+    """Return the integration wide startup coordinator."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (coordinator := data.get(DATA_STARTUP_COORDINATOR)) is None:
+        coordinator = data[DATA_STARTUP_COORDINATOR] = StartupCoordinator(
+            hass, DEFAULT_STARTUP_CONCURRENCY, DEFAULT_STARTUP_DELAY
+        )
+    return coordinator
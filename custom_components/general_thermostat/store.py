@@ -0,0 +1,73 @@
+"""Persistent storage of the runtime data of general thermostats."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_STORE, DOMAIN
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class ThermostatStore:
+    """Runtime data of all thermostats keyed by unique_id, saved in a single batched write."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, dict[str, Any]]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+        self._pending: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored data."""
+        if (data := await self._store.async_load()) is not None:
+            self._data = data["thermostats"]
+
+    @callback
+    def async_get(self, unique_id: str) -> dict[str, Any] | None:
+        """Return the stored data of a thermostat, including its pending changes.
+
+        A thermostat reloaded before the delayed save restores the data of the entity it
+        replaces instead of the data last written.
+        """
+        if (data_func := self._pending.pop(unique_id, None)) is not None:
+            self._data[unique_id] = data_func()
+        return self._data.get(unique_id)
+
+    @callback
+    def async_schedule_save(self, unique_id: str, data_func: Callable[[], dict[str, Any]]) -> None:
+        """Schedule saving the data of a thermostat, the data is collected at save time."""
+        self._pending[unique_id] = data_func
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove(self, unique_id: str) -> None:
+        """Remove the data of a thermostat."""
+        self._pending.pop(unique_id, None)
+        if self._data.pop(unique_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the data to save, collecting the pending changes."""
+        for unique_id, data_func in self._pending.items():
+            self._data[unique_id] = data_func()
+        self._pending.clear()
+        return {"thermostats": self._data}
+
+
+@callback
+def async_get_store(hass: HomeAssistant) -> ThermostatStore:
+    """Return the integration wide store."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (store := data.get(DATA_STORE)) is None:
+        store = data[DATA_STORE] = ThermostatStore(hass)
+    return store
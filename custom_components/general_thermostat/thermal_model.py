@@ -0,0 +1,196 @@
+"""Learned thermal model of general thermostats."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Forgetting factor of the recursive least squares, about the last 100 samples count
+FORGETTING_FACTOR = 0.99
+# Initial covariance, large as nothing is known of the parameters
+INITIAL_COVARIANCE = 1000.0
+# Minimum time between the readings of a rate sample in seconds, to average out the sensor resolution
+SAMPLE_INTERVAL = 300.0
+# Samples needed with the heater both on and off before the model is used
+MIN_SAMPLES = 3
+# Weight of a new lag observation
+LAG_SMOOTHING = 0.3
+# Drop of the temperature below its peak that ends the overshoot after a switch off
+PEAK_HYSTERESIS = 0.1
+# Longest overshoot observed after a switch off in seconds
+MAX_LAG = 7200.0
+
+
+class ThermalModel:
+    """Heating and idle rate of a zone and the lag of its heater, learned online.
+
+    The rate of the temperature change in degrees per hour is modelled as idle_rate +
+    gain * u, where u is 1 while the heater is on. The two parameters are estimated with
+    recursive least squares with forgetting, from rate samples taken at least
+    SAMPLE_INTERVAL apart while the heater state doesn't change. After a switch off the
+    temperature keeps rising for a while: the overshoot is observed until the temperature
+    drops below its peak, and converted to a lag time at the heating rate, which is
+    smoothed exponentially. Each reading is processed in O(1) time and memory.
+
+    The temperatures are in the direction of the heater, ie. negated for A/C.
+    """
+
+    __slots__ = (
+        "_anchor_heating",
+        "_anchor_temperature",
+        "_anchor_time",
+        "_off_rate",
+        "_off_temperature",
+        "_off_time",
+        "_p",
+        "_peak",
+        "gain",
+        "heating_samples",
+        "idle_rate",
+        "idle_samples",
+        "lag",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an untrained model."""
+        self.idle_rate = 0.0
+        self.gain = 0.0
+        self._p = [INITIAL_COVARIANCE, 0.0, 0.0, INITIAL_COVARIANCE]
+        self.heating_samples = 0
+        self.idle_samples = 0
+        self.lag = 0.0
+        self._anchor_temperature: float | None = None
+        self._anchor_time = 0.0
+        self._anchor_heating = False
+        self._peak: float | None = None
+        self._off_temperature = 0.0
+        self._off_time = 0.0
+        self._off_rate = 0.0
+
+    @property
+    def trained(self) -> bool:
+        """Return True if the model has enough samples to be used."""
+        return self.heating_samples >= MIN_SAMPLES and self.idle_samples >= MIN_SAMPLES
+
+    @property
+    def heating_rate(self) -> float:
+        """Return the rate of the temperature change while the heater is on, in degrees per hour."""
+        return self.idle_rate + self.gain
+
+    @property
+    def overshoot(self) -> float:
+        """Return the expected rise of the temperature after a switch off."""
+        if not self.trained or self.heating_rate <= 0:
+            return 0.0
+        return self.heating_rate * self.lag / 3600
+
+    def observe(self, temperature: float, timestamp: float, heating: bool) -> bool:
+        """Process a temperature reading, return True if the model was updated."""
+        updated = False
+        if self._peak is not None:
+            if temperature > self._peak:
+                self._peak = temperature
+            elif (
+                temperature <= self._peak - PEAK_HYSTERESIS
+                or timestamp - self._off_time >= MAX_LAG
+            ):
+                lag = (self._peak - self._off_temperature) / self._off_rate * 3600
+                self.lag += LAG_SMOOTHING * (min(lag, MAX_LAG) - self.lag)
+                self._peak = None
+                updated = True
+        if self._anchor_temperature is None or heating != self._anchor_heating:
+            self._set_anchor(temperature, timestamp, heating)
+            return updated
+        if (elapsed := timestamp - self._anchor_time) < SAMPLE_INTERVAL:
+            return updated
+        rate = (temperature - self._anchor_temperature) / elapsed * 3600
+        self._set_anchor(temperature, timestamp, heating)
+        if self._peak is not None:
+            # The idle rate is not sampled while the heater's residual heat still rises the temperature
+            return updated
+        self._update(rate, heating)
+        return True
+
+    def heater_switched(self, heating: bool, temperature: float | None, timestamp: float) -> None:
+        """Restart the sampling after a switch, and start observing the overshoot after a switch off."""
+        self._anchor_temperature = None
+        self._peak = None
+        if not heating and temperature is not None and self.trained and self.heating_rate > 0:
+            self._peak = self._off_temperature = temperature
+            self._off_time = timestamp
+            self._off_rate = self.heating_rate
+
+    def start_delay(self, temperature: float, target: float, seconds: float) -> float:
+        """Return the delay to turn the heater on after, to reach the target in seconds.
+
+        The temperature follows the idle rate until the heater is turned on, then the
+        heating rate. Without a trained model the heater is turned on at the end.
+        """
+        heating_rate = self.heating_rate / 3600
+        idle_rate = self.idle_rate / 3600
+        if not self.trained or heating_rate <= 0 or heating_rate <= idle_rate:
+            return seconds
+        delay = (heating_rate * seconds - (target - temperature)) / (heating_rate - idle_rate)
+        return min(max(delay, 0.0), seconds)
+
+    def _set_anchor(self, temperature: float, timestamp: float, heating: bool) -> None:
+        self._anchor_temperature = temperature
+        self._anchor_time = timestamp
+        self._anchor_heating = heating
+
+    def _update(self, rate: float, heating: bool) -> None:
+        """Update the parameters with a rate sample, x = (1, u)."""
+        u = 1.0 if heating else 0.0
+        p00, p01, p10, p11 = self._p
+        # P x
+        px0 = p00 + p01 * u
+        px1 = p10 + p11 * u
+        denominator = FORGETTING_FACTOR + px0 + u * px1
+        k0 = px0 / denominator
+        k1 = px1 / denominator
+        error = rate - (self.idle_rate + self.gain * u)
+        self.idle_rate += k0 * error
+        self.gain += k1 * error
+        # x' P
+        xp0 = p00 + u * p10
+        xp1 = p01 + u * p11
+        self._p = [
+            (p00 - k0 * xp0) / FORGETTING_FACTOR,
+            (p01 - k0 * xp1) / FORGETTING_FACTOR,
+            (p10 - k1 * xp0) / FORGETTING_FACTOR,
+            (p11 - k1 * xp1) / FORGETTING_FACTOR,
+        ]
+        if heating:
+            self.heating_samples += 1
+        else:
+            self.idle_samples += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned state of the model."""
+        return {
+            "idle_rate": self.idle_rate,
+            "gain": self.gain,
+            "covariance": self._p,
+            "heating_samples": self.heating_samples,
+            "idle_samples": self.idle_samples,
+            "lag": self.lag,
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore the learned state of the model."""
+        try:
+            idle_rate = float(data["idle_rate"])
+            gain = float(data["gain"])
+            covariance = [float(value) for value in data["covariance"]]
+            heating_samples = int(data["heating_samples"])
+            idle_samples = int(data["idle_samples"])
+            lag = float(data["lag"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if len(covariance) != 4:
+            return
+        self.idle_rate = idle_rate
+        self.gain = gain
+        self._p = covariance
+        self.heating_samples = heating_samples
+        self.idle_samples = idle_samples
+        self.lag = lag
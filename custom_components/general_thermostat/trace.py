@@ -0,0 +1,111 @@
+"""Bounded decision trace of general thermostats."""
+
+from __future__ import annotations
+
+from time import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+TRACE_SIZE = 128
+
+# The actions of the control decisions
+ACTION_IDLE = "idle"
+ACTION_LOAD_SHED = "load_shed"
+ACTION_MIN_CYCLE = "min_cycle"
+ACTION_TURN_ON = "turn_on"
+ACTION_TURN_OFF = "turn_off"
+ACTION_EARLY_OFF = "early_off"
+ACTION_FAILSAFE_OFF = "failsafe_off"
+ACTION_KEEP_ALIVE_ON = "keep_alive_on"
+ACTION_KEEP_ALIVE_OFF = "keep_alive_off"
+
+
+class _DecisionRecord:
+    """A control decision with its inputs."""
+
+    __slots__ = (
+        "action",
+        "cold_tolerance",
+        "current_temperature",
+        "force",
+        "heater_active",
+        "hot_tolerance",
+        "keep_alive",
+        "target_temperature",
+        "timestamp",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty record."""
+        self.timestamp = 0.0
+        self.current_temperature: float | None = None
+        self.target_temperature: float | None = None
+        self.cold_tolerance: float | None = None
+        self.hot_tolerance: float | None = None
+        self.heater_active: bool | None = None
+        self.force = False
+        self.keep_alive = False
+        self.action = ACTION_IDLE
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a dict."""
+        return {
+            "time": dt_util.utc_from_timestamp(self.timestamp).isoformat(),
+            "current_temperature": self.current_temperature,
+            "target_temperature": self.target_temperature,
+            "cold_tolerance": self.cold_tolerance,
+            "hot_tolerance": self.hot_tolerance,
+            "heater_active": self.heater_active,
+            "force": self.force,
+            "keep_alive": self.keep_alive,
+            "action": self.action,
+        }
+
+
+class DecisionTrace:
+    """Ring buffer of the last TRACE_SIZE control decisions.
+
+    The records are allocated once and overwritten in place, so the memory used is
+    constant however long the thermostat runs.
+    """
+
+    __slots__ = ("_count", "_records")
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self._records = [_DecisionRecord() for _ in range(TRACE_SIZE)]
+        self._count = 0
+
+    def record(
+        self,
+        current_temperature: float | None,
+        target_temperature: float | None,
+        cold_tolerance: float | None,
+        hot_tolerance: float | None,
+        heater_active: bool | None,
+        force: bool,
+        keep_alive: bool,
+        action: str,
+    ) -> None:
+        """Record a decision, overwriting the oldest one if the trace is full."""
+        record = self._records[self._count % TRACE_SIZE]
+        self._count += 1
+        record.timestamp = time()
+        record.current_temperature = current_temperature
+        record.target_temperature = target_temperature
+        record.cold_tolerance = cold_tolerance
+        record.hot_tolerance = hot_tolerance
+        record.heater_active = heater_active
+        record.force = force
+        record.keep_alive = keep_alive
+        record.action = action
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the recorded decisions, oldest first."""
+        if self._count <= TRACE_SIZE:
+            records = self._records[: self._count]
+        else:
+            start = self._count % TRACE_SIZE
+            records = self._records[start:] + self._records[:start]
+        return [record.as_dict() for record in records]
@@ -0,0 +1,137 @@
+"""Integration wide sensor staleness watchdog of general thermostats."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import heapq
+import itertools
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SENSOR_WATCHDOG, DOMAIN
+
+
+class _WatchEntry:
+    """A watched thermostat and its current deadline."""
+
+    __slots__ = ("cancelled", "deadline", "expired", "timeout")
+
+    def __init__(self, timeout: float, expired: Callable[[], None]) -> None:
+        """Initialize the entry."""
+        self.cancelled = False
+        self.deadline: float | None = None
+        self.expired = expired
+        self.timeout = timeout
+
+
+class SensorWatchdog:
+    """Call back the thermostats whose sensors didn't report within their timeout.
+
+    The deadlines of all thermostats are kept in a single heap with a single timer armed
+    for the earliest one. Feeding a thermostat pushes its new deadline in O(log n), the
+    superseded entries are skipped lazily and dropped when they outnumber the live ones.
+    An expired thermostat is called back once, until it is fed again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the watchdog."""
+        self._hass = hass
+        self._entries: dict[str, _WatchEntry] = {}
+        self._heap: list[tuple[float, int, _WatchEntry]] = []
+        self._sequence = itertools.count()
+        self._timer_at: float | None = None
+        self._remove_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self, key: str, timeout: timedelta, expired: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Start watching a thermostat, return a callback that stops it."""
+        entry = self._entries[key] = _WatchEntry(timeout.total_seconds(), expired)
+        self.async_feed(key)
+
+        @callback
+        def _async_unregister() -> None:
+            entry.cancelled = True
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+        return _async_unregister
+
+    @callback
+    def async_feed(self, key: str) -> None:
+        """Push the deadline of a thermostat, its sensors just reported."""
+        if (entry := self._entries.get(key)) is None:
+            return
+        deadline = entry.deadline = dt_util.utcnow().timestamp() + entry.timeout
+        heapq.heappush(self._heap, (deadline, next(self._sequence), entry))
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [item for item in self._heap if self._is_live(item)]
+            heapq.heapify(self._heap)
+        if self._timer_at is None or deadline < self._timer_at:
+            self._async_arm_timer()
+
+    @staticmethod
+    def _is_live(item: tuple[float, int, _WatchEntry]) -> bool:
+        """Return True if the heap item is the current deadline of its entry."""
+        deadline, _, entry = item
+        return not entry.cancelled and entry.deadline == deadline
+
+    @callback
+    def _async_arm_timer(self) -> None:
+        """Arm the timer for the earliest live deadline."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        due = self._heap[0][0] if self._heap else None
+        if due == self._timer_at:
+            return
+        if self._remove_timer is not None:
+            self._remove_timer()
+            self._remove_timer = None
+        self._timer_at = due
+        if due is not None:
+            self._remove_timer = async_track_point_in_utc_time(
+                self._hass, self._async_fire, dt_util.utc_from_timestamp(due)
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Call back the expired thermostats."""
+        # The scheduled time is rounded to the microsecond, it can be before the deadline
+        # it was armed for, which must be popped or the same time would be re-armed forever
+        timestamp = now.timestamp()
+        if self._timer_at is not None:
+            timestamp = max(timestamp, self._timer_at)
+        self._remove_timer = None
+        self._timer_at = None
+        while self._heap and self._heap[0][0] <= timestamp:
+            item = heapq.heappop(self._heap)
+            if not self._is_live(item):
+                continue
+            entry = item[2]
+            entry.deadline = None
+            entry.expired()
+        self._async_arm_timer()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the watchdog."""
+        return {
+            "watched": len(self._entries),
+            "heap_size": len(self._heap),
+            "next_deadline": None
+            if self._timer_at is None
+            else dt_util.utc_from_timestamp(self._timer_at).isoformat(),
+        }
+
+
+@callback
+def async_get_sensor_watchdog(hass: HomeAssistant) -> SensorWatchdog:
+    """Return the integration wide sensor watchdog."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (watchdog := data.get(DATA_SENSOR_WATCHDOG)) is None:
+        watchdog = data[DATA_SENSOR_WATCHDOG] = SensorWatchdog(hass)
+    return watchdog
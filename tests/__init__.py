@@ -0,0 +1 @@
+"""Tests for the general_thermostat integration."""
@@ -0,0 +1,76 @@
+"""Fixtures for the general_thermostat tests."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.general_thermostat.const import DOMAIN, SERVICE_DUMP_TRACE
+
+ENTITY = "climate.test"
+HEATER = "input_boolean.test_heater"
+SENSOR = "sensor.test_temperature"
+
+SetupThermostat = Callable[..., Awaitable[None]]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable the custom integration in all tests."""
+
+
+@pytest.fixture
+async def setup_thermostat(hass: HomeAssistant) -> SetupThermostat:
+    """Return a function setting up a YAML thermostat named test with its options.
+
+    The heater is an input_boolean switched by the homeassistant.turn_on/turn_off actions,
+    the sensor states must be set before.
+    """
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(
+        hass, "input_boolean", {"input_boolean": {"test_heater": None}}
+    )
+
+    async def _async_setup(domain_config: dict[str, Any] | None = None, **options: Any) -> None:
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: domain_config or {}})
+        assert await async_setup_component(
+            hass,
+            CLIMATE_DOMAIN,
+            {
+                CLIMATE_DOMAIN: {
+                    "platform": DOMAIN,
+                    "name": "test",
+                    "heater": HEATER,
+                    "target_sensor": SENSOR,
+                    **options,
+                }
+            },
+        )
+        await hass.async_block_till_done()
+
+    return _async_setup
+
+
+def heater_on(hass: HomeAssistant) -> bool:
+    """Return True if the test heater is on."""
+    return hass.states.is_state(HEATER, STATE_ON)
+
+
+async def async_trace_actions(hass: HomeAssistant, entity_id: str = ENTITY) -> list[str]:
+    """Return the actions of the decision trace of a thermostat."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_DUMP_TRACE,
+        target={"entity_id": entity_id},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    return [record["action"] for record in response[entity_id]["decision_trace"]]
@@ -0,0 +1,82 @@
+"""Tests for the general_thermostat climate platform."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+
+from custom_components.general_thermostat.const import DOMAIN
+
+from .conftest import ENTITY, SENSOR, SetupThermostat, async_trace_actions, heater_on
+
+SENSOR_2 = "sensor.test_temperature_2"
+
+
+async def test_threshold_crossing_near_quantization(
+    hass: HomeAssistant, setup_thermostat: SetupThermostat
+) -> None:
+    """Test a reading quantized to the written temperature still crosses the threshold."""
+    hass.states.async_set(SENSOR, "19.72")
+    await setup_thermostat(
+        target_temp=20,
+        cold_tolerance=0.3,
+        hot_tolerance=0.3,
+        precision=0.1,
+        initial_hvac_mode="heat",
+    )
+    assert not heater_on(hass)
+    assert hass.states.get(ENTITY).attributes["current_temperature"] == 19.7
+
+    # Both readings are written as 19.7, but they are below the 19.7 turn on threshold
+    hass.states.async_set(SENSOR, "19.68")
+    await hass.async_block_till_done()
+    assert heater_on(hass)
+
+
+async def test_max_age_with_unchanged_reports(
+    hass: HomeAssistant, setup_thermostat: SetupThermostat, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a sensor reporting an unchanged temperature is not aged out."""
+    hass.states.async_set(SENSOR, "20.0")
+    hass.states.async_set(SENSOR_2, "20.0")
+    await setup_thermostat(
+        target_sensor=[SENSOR, SENSOR_2],
+        sensor_max_age={"minutes": 10},
+        target_temp=21,
+        initial_hvac_mode="heat",
+    )
+
+    freezer.tick(timedelta(minutes=8))
+    hass.states.async_set(SENSOR, "20.0")
+    await hass.async_block_till_done()
+    freezer.tick(timedelta(minutes=5))
+    hass.states.async_set(SENSOR_2, "22.0")
+    await hass.async_block_till_done()
+
+    assert hass.states.get(ENTITY).attributes["current_temperature"] == 21.0
+
+
+async def test_sensor_timeout_single_forced_evaluation(
+    hass: HomeAssistant, setup_thermostat: SetupThermostat, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a sensor timeout runs the fail-safe action once and raises an issue."""
+    hass.states.async_set(SENSOR, "18.0")
+    await setup_thermostat(
+        target_temp=21, sensor_timeout={"minutes": 30}, initial_hvac_mode="heat"
+    )
+    assert heater_on(hass)
+    before = await async_trace_actions(hass)
+
+    freezer.tick(timedelta(minutes=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert not heater_on(hass)
+    assert (await async_trace_actions(hass))[len(before):] == ["failsafe_off"]
+    assert ir.async_get(hass).async_get_issue(DOMAIN, f"sensor_timeout_{ENTITY}") is not None
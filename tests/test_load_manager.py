@@ -0,0 +1,33 @@
+"""Tests for the load manager of general thermostats."""
+
+from __future__ import annotations
+
+from custom_components.general_thermostat.load_manager import LoadManager
+
+
+def test_request_granted_while_others_wait() -> None:
+    """Test a request that fits and comes first is granted without a release."""
+    manager = LoadManager(None, 3000)
+    granted: list[str] = []
+
+    assert manager.async_request("a", 2000, 1.0, lambda: granted.append("a"))
+    assert not manager.async_request("b", 2000, 2.0, lambda: granted.append("b"))
+    assert manager.async_request("c", 1000, 3.0, lambda: granted.append("c"))
+    assert granted == []
+
+    manager.async_release("a")
+    manager.async_release("c")
+    assert granted == ["b"]
+
+
+def test_request_queued_behind_higher_priority() -> None:
+    """Test a request that fits waits behind a waiting request with a higher deficit."""
+    manager = LoadManager(1, None)
+    granted: list[str] = []
+
+    assert manager.async_request("a", 0, 1.0, lambda: granted.append("a"))
+    assert not manager.async_request("b", 0, 3.0, lambda: granted.append("b"))
+    assert not manager.async_request("c", 0, 2.0, lambda: granted.append("c"))
+
+    manager.async_release("a")
+    assert granted == ["b"]
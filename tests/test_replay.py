@@ -0,0 +1,61 @@
+"""Tests for the replay of recorded thermostat traces."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import replay  # noqa: E402
+from virtual_clock import VirtualClockEventLoop  # noqa: E402
+
+HEATER = "switch.replay_heater"
+SENSOR = "sensor.replay_temperature"
+
+
+def test_replay_timing(tmp_path: Path) -> None:
+    """Test the records are replayed at their times from the thermostat setup."""
+    trace = tmp_path / "trace.jsonl"
+    header = {
+        "format": replay.TRACE_FORMAT,
+        "version": replay.TRACE_VERSION,
+        "start": "2026-01-05T06:00:00+00:00",
+        "config": {
+            "name": "Replay",
+            "heater": HEATER,
+            "target_sensor": SENSOR,
+            "target_temp": 21,
+            "initial_hvac_mode": "heat",
+        },
+        "states": {SENSOR: "21.0", HEATER: "off"},
+    }
+    records = [
+        {"t": 60, "sensor": "20.0", "entity_id": SENSOR},
+        {"t": 600, "sensor": "22.0", "entity_id": SENSOR},
+    ]
+    trace.write_text(
+        "".join(json.dumps(line) + "\n" for line in (header, *records)), encoding="utf-8"
+    )
+    output = tmp_path / "output.jsonl"
+
+    loop = VirtualClockEventLoop()
+    try:
+        loop.run_until_complete(
+            replay.async_replay(
+                argparse.Namespace(
+                    trace=str(trace), output=str(output), apply_heater_events=False
+                )
+            )
+        )
+    finally:
+        loop.close()
+
+    results = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [(result["t"], result["command"]) for result in results if "command" in result] == [
+        (60.0, "turn_on"),
+        (600.0, "turn_off"),
+    ]
+    assert results[-1]["switch_cycles"] == 1